@@ -1,13 +1,35 @@
 import os
+import sys
+import csv # Header peek for the pyarrow CSV reader and the absent-identifier log
 from datetime import datetime
+import numpy as np
 import pandas as pd
 import streamlit as st
 import io # Needed for file uploads
 import shutil # For file operations
 import json # For version control
-from typing import Union # Import Union
+import hashlib # Backup manifests
+from concurrent.futures import ThreadPoolExecutor # Parallel backup file copies
+from typing import Iterable, Union
 import ui_components  # Reusable Streamlit components
 
+try:  # pyarrow ships with Streamlit; fall back to pandas' C parser if it is unavailable
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pa_pq
+except ImportError:
+    pa = None
+
+try:  # orjson is optional; the stdlib json module is used when it is not installed
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # fcntl is POSIX-only; without it backups skip straight to the regular copy paths
+    import fcntl
+except ImportError:
+    fcntl = None
+
 ###############################################################################
 # Version Control & Migration
 ###############################################################################
@@ -19,9 +41,10 @@ def get_current_schema_version():
     """Get the current schema version from the version file."""
     if os.path.exists(VERSION_FILE):
         try:
-            with open(VERSION_FILE, 'r') as f:
-                version_data = json.load(f)
-                return version_data.get('schema_version', '0.0.0')
+            with open(VERSION_FILE, 'rb') as f:
+                raw = f.read()
+            version_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            return version_data.get('schema_version', '0.0.0')
         except (json.JSONDecodeError, IOError):
             return '0.0.0'
     return '0.0.0'
@@ -29,32 +52,151 @@ def get_current_schema_version():
 def update_schema_version(new_version):
     """Update the schema version in the version file."""
     version_data = {'schema_version': new_version, 'updated_at': datetime.now().isoformat()}
-    with open(VERSION_FILE, 'w') as f:
-        json.dump(version_data, f)
+    with open(VERSION_FILE, 'wb') as f:
+        f.write(orjson.dumps(version_data) if orjson is not None else json.dumps(version_data).encode())
+
+COPY_BUFFER_SIZE = 1 << 20  # 1 MiB chunks when the kernel copy paths are unavailable
+# Linux ioctl that clones a file's extents copy-on-write; the number means nothing (or something else) elsewhere
+FICLONE = getattr(fcntl, "FICLONE", 0x40049409) if fcntl is not None and sys.platform.startswith("linux") else None
+
+def _copy_file(source_path: str, dest_path: str) -> None:
+    """Copy a file with its metadata, letting the kernel move the bytes where it can.
+
+    On Linux, first tries a reflink clone (FICLONE), which shares the data copy-on-write on Btrfs,
+    XFS and similar filesystems, then copy_file_range, then sendfile, and finishes with
+    buffered 1 MiB reads for whatever those did not transfer (other platforms, or
+    filesystems that refuse them).
+    """
+    with open(source_path, 'rb') as src, open(dest_path, 'wb') as dst:
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        size = os.fstat(src_fd).st_size
+        copied = 0
+        if FICLONE is not None and size:
+            try:
+                fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                copied = size
+            except OSError:
+                pass # Different filesystem or no reflink support
+        if copied < size and hasattr(os, "copy_file_range"):
+            try:
+                while copied < size:
+                    sent = os.copy_file_range(src_fd, dst_fd, size - copied, copied, copied)
+                    if sent == 0:
+                        break
+                    copied += sent
+            except OSError:
+                pass
+        if copied < size and hasattr(os, "sendfile"):
+            try:
+                os.lseek(dst_fd, copied, os.SEEK_SET)
+                while copied < size:
+                    sent = os.sendfile(dst_fd, src_fd, copied, size - copied)
+                    if sent == 0:
+                        break
+                    copied += sent
+            except OSError:
+                pass
+        if copied < size:
+            src.seek(copied)
+            dst.seek(copied)
+            while True:
+                buf = src.read(COPY_BUFFER_SIZE)
+                if not buf:
+                    break
+                dst.write(buf)
+    shutil.copystat(source_path, dest_path)
+
+BACKUP_MANIFEST = "manifest.json"  # {file name: content digest} written into each backup
+
+def _file_digest(path: str) -> str:
+    """blake2b digest of a file's contents."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(COPY_BUFFER_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _latest_backup_manifest(exclude_path: str) -> tuple:
+    """Return (backup path, manifest dict) of the most recent backup that has a manifest."""
+    backup_names = sorted(
+        (d for d in os.listdir(BACKUP_DIR) if os.path.join(BACKUP_DIR, d) != exclude_path),
+        reverse=True
+    )
+    for name in backup_names:
+        manifest_path = os.path.join(BACKUP_DIR, name, BACKUP_MANIFEST)
+        if os.path.isfile(manifest_path):
+            try:
+                with open(manifest_path, 'r') as f:
+                    return os.path.join(BACKUP_DIR, name), json.load(f)
+            except (json.JSONDecodeError, IOError):
+                continue
+    return None, {}
 
 def create_backup():
-    """Create a timestamped backup of all data files."""
+    """Create a timestamped backup of all data files.
+    Files unchanged since the previous backup are hard-linked to it instead of copied.
+    """
     if not os.path.exists(DATA_DIR):
         return False
     
     if not os.path.exists(BACKUP_DIR):
         os.makedirs(BACKUP_DIR)
     
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    # Every backup gets a folder of its own: files in an earlier one may be hard links shared
+    # with older backups, so writing into it would rewrite those too
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
     backup_path = os.path.join(BACKUP_DIR, f"backup_{timestamp}")
-    os.makedirs(backup_path, exist_ok=True)
+    suffix = 0
+    while True:
+        try:
+            os.makedirs(backup_path)
+            break
+        except FileExistsError:
+            suffix += 1
+            backup_path = os.path.join(BACKUP_DIR, f"backup_{timestamp}_{suffix}")
+    previous_backup_path, previous_manifest = _latest_backup_manifest(backup_path)
+
+    def backup_one(entry) -> tuple:
+        dest_path = os.path.join(backup_path, entry.name)
+        if os.path.lexists(dest_path):
+            os.unlink(dest_path) # Never write through an existing (possibly shared) file
+        file_digest = _file_digest(entry.path)
+        if previous_manifest.get(entry.name) == file_digest:
+            try:
+                os.link(os.path.join(previous_backup_path, entry.name), dest_path)
+                return entry.name, file_digest
+            except OSError:
+                pass # Previous copy missing or links unsupported: copy instead
+        _copy_file(entry.path, dest_path)
+        return entry.name, file_digest
     
     # Copy all CSV files to the backup directory
-    for file_name in os.listdir(DATA_DIR):
-        if file_name.endswith('.csv'):
-            source_path = os.path.join(DATA_DIR, file_name)
-            dest_path = os.path.join(backup_path, file_name)
-            shutil.copy2(source_path, dest_path)
+    with os.scandir(DATA_DIR) as entries:
+        csv_entries = [e for e in entries if e.name.endswith('.csv') and e.is_file()]
+    manifest = {}
+    if csv_entries:
+        with ThreadPoolExecutor(max_workers=min(8, len(csv_entries))) as executor:
+            manifest = dict(executor.map(backup_one, csv_entries))
+    with open(os.path.join(backup_path, BACKUP_MANIFEST), 'w') as f:
+        json.dump(manifest, f)
     
     return backup_path
 
+@st.cache_data
+def _list_backups(dir_mtime_ns: int) -> list:
+    """List backup directories, most recent first.
+
+    *dir_mtime_ns* is the backups directory's mtime; it only serves as the cache key so the
+    listing is redone when a backup is added or removed.
+    """
+    # scandir reports the entry type from the directory read itself, so no extra stat per entry
+    with os.scandir(BACKUP_DIR) as entries:
+        return sorted((entry.name for entry in entries if entry.is_dir()), reverse=True)
+
 def run_migrations(from_version, to_version):
     """Run database migrations from one version to another."""
+    if from_version == to_version:
+        return True # Already current: no backup, no disk work
     # Define migrations as a dictionary with from_version -> to_version keys and migration functions as values
     migrations = {
         '0.0.0->1.0.0': migrate_from_0_to_1,
@@ -65,52 +207,77 @@ def run_migrations(from_version, to_version):
         '1.2.2->1.2.3': migrate_from_1_2_2_to_1_2_3
     }
     
-    # Execute appropriate migration based on version transition
     migration_key = f'{from_version}->{to_version}'
-    if migration_key in migrations:
-        # Create backup before running migrations
-        backup_path = create_backup()
-        st.info(f"Created backup at {backup_path} before applying migrations")
-        
-        # Run the migration
-        migrations[migration_key]()
-        update_schema_version(to_version)
-        st.success(f"Successfully migrated from v{from_version} to v{to_version}")
-        return True
-    
     # If we're on a new installation (version 0.0.0), just update the version
-    if from_version == '0.0.0':
+    if from_version == '0.0.0' and migration_key not in migrations:
         update_schema_version(to_version)
         return True
-        
-    return False
+
+    # Chain single-step migrations from from_version until to_version is reached
+    next_step = {key.split('->')[0]: key for key in migrations}
+    chain = []
+    version = from_version
+    while version != to_version and version in next_step:
+        chain.append(next_step[version])
+        version = next_step[version].split('->')[1]
+    if not chain or version != to_version:
+        return False
+
+    # Create backup before running migrations
+    backup_path = create_backup()
+    st.info(f"Created backup at {backup_path} before applying migrations")
+
+    i = 0
+    while i < len(chain):
+        # Consecutive participants-only steps share one read and write of participants.csv
+        fused_steps = []
+        while i < len(chain) and chain[i] in PARTICIPANT_SCHEMA_STEPS:
+            fused_steps.append(chain[i])
+            i += 1
+        if len(fused_steps) > 1:
+            migrate_participants_schema_steps(fused_steps)
+        elif fused_steps:
+            migrations[fused_steps[0]]()
+        else:
+            migrations[chain[i]]()
+            i += 1
+    update_schema_version(to_version)
+    st.success(f"Successfully migrated from v{from_version} to v{to_version}")
+    return True
+
+def _csv_columns(path: str) -> list:
+    """Column names of a CSV, read from its header row only.
+    Migrations use it to skip parsing files that already have the target schema.
+    """
+    return pd.read_csv(path, nrows=0).columns.tolist()
 
 # Example migration function
 def migrate_from_0_to_1():
     """Migration from version 0.0.0 to 1.0.0."""
     try:
-        # Add "Last Updated" column to participants.csv if it doesn't exist
-        if os.path.exists(os.path.join(DATA_DIR, "participants.csv")):
-            df = pd.read_csv(os.path.join(DATA_DIR, "participants.csv"))
+        # Add "Last Updated" and "Hosted" columns to participants.csv in one read/write
+        participants_path = os.path.join(DATA_DIR, "participants.csv")
+        if os.path.exists(participants_path) and not {"Last Updated", "Hosted"}.issubset(_csv_columns(participants_path)):
+            df = pd.read_csv(participants_path)
+            changed = False
             if "Last Updated" not in df.columns:
                 df["Last Updated"] = ""
-                df.to_csv(os.path.join(DATA_DIR, "participants.csv"), index=False)
                 st.info("Added 'Last Updated' column to participants.csv")
-        
-        # Add "Hosted" field to participants.csv if it doesn't exist
-        if os.path.exists(os.path.join(DATA_DIR, "participants.csv")):
-            df = pd.read_csv(os.path.join(DATA_DIR, "participants.csv"))
+                changed = True
             if "Hosted" not in df.columns:
                 df["Hosted"] = "No"  # Default all existing records to "No"
-                df.to_csv(os.path.join(DATA_DIR, "participants.csv"), index=False)
                 st.info("Added 'Hosted' column to participants.csv")
+                changed = True
+            if changed:
+                _fast_to_csv(df, participants_path)
         
         # Add "Hosted" field to events.csv if it doesn't exist
-        if os.path.exists(os.path.join(DATA_DIR, "events.csv")):
-            df = pd.read_csv(os.path.join(DATA_DIR, "events.csv"))
+        events_path = os.path.join(DATA_DIR, "events.csv")
+        if os.path.exists(events_path) and "Hosted" not in _csv_columns(events_path):
+            df = pd.read_csv(events_path)
             if "Hosted" not in df.columns:
                 df["Hosted"] = ""  # Empty list of hosted IDs
-                df.to_csv(os.path.join(DATA_DIR, "events.csv"), index=False)
+                _fast_to_csv(df, events_path)
                 st.info("Added 'Hosted' column to events.csv")
     except Exception as e:
         st.error(f"Migration failed: {str(e)}")
@@ -125,7 +292,8 @@ def migrate_from_1_0_0_to_1_1_0():
     """
     try:
         cohorts_path = os.path.join(DATA_DIR, "cohorts.csv")
-        if os.path.exists(cohorts_path):
+        cohort_cols = _csv_columns(cohorts_path) if os.path.exists(cohorts_path) else None
+        if cohort_cols is not None and ("Nominees" in cohort_cols or "Participants" in cohort_cols or "Invited" not in cohort_cols):
             df = pd.read_csv(cohorts_path)
             changes_made = False
             # Rename Nominees to Nominated
@@ -161,13 +329,20 @@ def migrate_from_1_0_0_to_1_1_0():
                 changes_made = True
             
             if changes_made:
-                df.to_csv(cohorts_path, index=False)
+                _fast_to_csv(df, cohorts_path)
                 st.info("cohorts.csv updated by migration to v1.1.0")
 
     except Exception as e:
         st.error(f"Migration to 1.1.0 (cohorts) failed: {str(e)}")
         raise
 
+def _group_keys_by_member(df: pd.DataFrame, key_col: str, list_col: str) -> dict:
+    """Map each ID in the comma-separated *list_col* to the set of *key_col* values listing it."""
+    members = df[[key_col]].assign(member=df[list_col].str.split(",")).explode("member")
+    members["member"] = members["member"].str.strip()
+    members = members[members["member"].ne("") & members[key_col].ne("")] # Empty IDs never enter the sets
+    return members.groupby("member")[key_col].agg(set).to_dict()
+
 # Migration for version 1.2.0: Restructures participants.csv
 def migrate_from_1_1_0_to_1_2_0():
     """Migration from v1.1.0 to v1.2.0:
@@ -193,7 +368,7 @@ def migrate_from_1_1_0_to_1_2_0():
                     pass # Will be overwritten
             
             if create_new_empty:
-                pd.DataFrame(columns=new_participant_cols).to_csv(participants_path, index=False)
+                _fast_to_csv(pd.DataFrame(columns=new_participant_cols), participants_path)
                 st.info("Created empty participants.csv with new schema.")
             return
 
@@ -221,20 +396,17 @@ def migrate_from_1_1_0_to_1_2_0():
         old_participants_path = os.path.join(DATA_DIR, "participants.csv")
         if os.path.exists(old_participants_path):
             try:
-                old_participants_df = pd.read_csv(old_participants_path, dtype=str, na_filter=False).fillna("")
+                old_participants_df = _read_csv_as_str(old_participants_path)
                 # Check if it's the old format by looking for "Event ID" and "Registered" etc.
                 if "Event ID" in old_participants_df.columns and "Registered" in old_participants_df.columns:
                     st.info("Processing data from existing (old format) participants.csv...")
-                    for _, row in old_participants_df.iterrows():
-                        emp_id = str(row["Standard ID"])
-                        event_id = str(row["Event ID"])
-                        if emp_id in agg_data: # Ensure employee exists in our master list
-                            if str(row.get("Registered", "")).lower() == "yes":
-                                agg_data[emp_id]["Events Registered"].add(event_id)
-                            if str(row.get("Participated", "")).lower() == "yes":
-                                agg_data[emp_id]["Events Participated"].add(event_id)
-                            if str(row.get("Hosted", "")).lower() == "yes":
-                                agg_data[emp_id]["Events Hosted"].add(event_id)
+                    for flag_col, agg_col in (("Registered", "Events Registered"), ("Participated", "Events Participated"), ("Hosted", "Events Hosted")):
+                        if flag_col not in old_participants_df.columns:
+                            continue
+                        flagged_rows = old_participants_df[old_participants_df[flag_col].str.lower().eq("yes") & old_participants_df["Event ID"].ne("")]
+                        for emp_id, event_ids in flagged_rows.groupby("Standard ID")["Event ID"].agg(set).items():
+                            if emp_id in agg_data: # Ensure employee exists in our master list
+                                agg_data[emp_id][agg_col] |= event_ids
                     st.info("Completed processing old participants.csv data.")
                 else:
                     st.info("Existing participants.csv does not seem to be old format. Will ensure schema matches new format.")
@@ -245,22 +417,14 @@ def migrate_from_1_1_0_to_1_2_0():
         events_path = _path_for("events")
         if os.path.exists(events_path):
             try:
-                events_df = pd.read_csv(events_path, dtype=str, na_filter=False).fillna("")
+                events_df = _read_csv_as_str(events_path)
                 st.info("Processing data from events.csv...")
-                for _, event_row in events_df.iterrows():
-                    event_id = str(event_row["Event ID"])
-                    for emp_id_str in str(event_row.get("Registrations", "")).split(','):
-                        emp_id = emp_id_str.strip()
-                        if emp_id and emp_id in agg_data:
-                            agg_data[emp_id]["Events Registered"].add(event_id)
-                    for emp_id_str in str(event_row.get("Participants", "")).split(','):
-                        emp_id = emp_id_str.strip()
-                        if emp_id and emp_id in agg_data:
-                            agg_data[emp_id]["Events Participated"].add(event_id)
-                    for emp_id_str in str(event_row.get("Hosted", "")).split(','):
-                        emp_id = emp_id_str.strip()
-                        if emp_id and emp_id in agg_data:
-                            agg_data[emp_id]["Events Hosted"].add(event_id)
+                # Missing link columns read as empty
+                event_cols = events_df.reindex(columns=["Event ID", "Registrations", "Participants", "Hosted"], fill_value="")
+                for list_col, agg_col in (("Registrations", "Events Registered"), ("Participants", "Events Participated"), ("Hosted", "Events Hosted")):
+                    for emp_id, event_ids in _group_keys_by_member(event_cols, "Event ID", list_col).items():
+                        if emp_id in agg_data:
+                            agg_data[emp_id][agg_col] |= event_ids
                 st.info("Completed processing events.csv data.")
             except Exception as e:
                 st.error(f"Failed to process events.csv during migration: {e}")
@@ -270,22 +434,13 @@ def migrate_from_1_1_0_to_1_2_0():
         cohorts_path = _path_for("cohorts")
         if os.path.exists(cohorts_path):
             try:
-                cohorts_df = pd.read_csv(cohorts_path, dtype=str, na_filter=False).fillna("")
+                cohorts_df = _read_csv_as_str(cohorts_path)
                 st.info("Processing data from cohorts.csv...")
-                for _, cohort_row in cohorts_df.iterrows():
-                    cohort_name = str(cohort_row["Name"])
-                    for emp_id_str in str(cohort_row.get("Nominated", "")).split(','): # Uses "Nominated" from v1.1.0
-                        emp_id = emp_id_str.strip()
-                        if emp_id and emp_id in agg_data:
-                            agg_data[emp_id]["Cohorts Nominated"].add(cohort_name)
-                    for emp_id_str in str(cohort_row.get("Invited", "")).split(','):
-                        emp_id = emp_id_str.strip()
-                        if emp_id and emp_id in agg_data:
-                            agg_data[emp_id]["Cohorts Invited"].add(cohort_name)
-                    for emp_id_str in str(cohort_row.get("Joined", "")).split(','): # Uses "Joined" from v1.1.0
-                        emp_id = emp_id_str.strip()
-                        if emp_id and emp_id in agg_data:
-                            agg_data[emp_id]["Cohorts Joined"].add(cohort_name)
+                cohort_cols = cohorts_df.reindex(columns=["Name", "Nominated", "Invited", "Joined"], fill_value="") # Uses "Nominated"/"Joined" from v1.1.0
+                for list_col, agg_col in (("Nominated", "Cohorts Nominated"), ("Invited", "Cohorts Invited"), ("Joined", "Cohorts Joined")):
+                    for emp_id, cohort_names in _group_keys_by_member(cohort_cols, "Name", list_col).items():
+                        if emp_id in agg_data:
+                            agg_data[emp_id][agg_col] |= cohort_names
                 st.info("Completed processing cohorts.csv data.")
             except Exception as e:
                 st.error(f"Failed to process cohorts.csv during migration: {e}")
@@ -293,28 +448,15 @@ def migrate_from_1_1_0_to_1_2_0():
         
         # Populate the new_participants_df with aggregated data
         st.info("Aggregating processed data into new participants structure...")
-        for emp_id, data_sets in agg_data.items():
-            idx = new_participants_df[new_participants_df["Standard ID"] == emp_id].index
-            if not idx.empty:
-                target_idx = idx[0]
-                new_participants_df.loc[target_idx, "Events Registered"] = ",".join(sorted(list(filter(None, data_sets["Events Registered"]))))
-                new_participants_df.loc[target_idx, "Events Participated"] = ",".join(sorted(list(filter(None, data_sets["Events Participated"]))))
-                new_participants_df.loc[target_idx, "Events Hosted"] = ",".join(sorted(list(filter(None, data_sets["Events Hosted"]))))
-                new_participants_df.loc[target_idx, "Cohorts Nominated"] = ",".join(sorted(list(filter(None, data_sets["Cohorts Nominated"]))))
-                new_participants_df.loc[target_idx, "Cohorts Invited"] = ",".join(sorted(list(filter(None, data_sets["Cohorts Invited"]))))
-                new_participants_df.loc[target_idx, "Cohorts Joined"] = ",".join(sorted(list(filter(None, data_sets["Cohorts Joined"]))))
-                # "Nominated By" remains empty for now as this data isn't tracked previously
-                new_participants_df.loc[target_idx, "Nominated By"] = "" 
-        
-        # Ensure all columns are present and fill NaNs just in case
-        for col in new_participants_cols:
-            if col not in new_participants_df.columns:
-                new_participants_df[col] = ""
-        new_participants_df = new_participants_df.fillna("")
+        for col in ("Events Registered", "Events Participated", "Events Hosted", "Cohorts Nominated", "Cohorts Invited", "Cohorts Joined"):
+            col_map = {emp_id: ",".join(sorted(data_sets[col])) for emp_id, data_sets in agg_data.items()} # Sorted for stable diffs
+            new_participants_df[col] = new_participants_df["Standard ID"].map(col_map).fillna("")
+        # "Nominated By" remains empty for now as this data isn't tracked previously
+        new_participants_df["Nominated By"] = ""
 
         # Save the new participants.csv
         final_participants_path = _path_for("participants")
-        new_participants_df[new_participants_cols].to_csv(final_participants_path, index=False) # Enforce column order
+        _fast_to_csv(new_participants_df, final_participants_path, new_participants_cols) # Enforce column order
         st.success("Successfully migrated participants data to new structure (v1.2.0).")
         load_table.clear() # Clear cache
 
@@ -323,6 +465,62 @@ def migrate_from_1_1_0_to_1_2_0():
         st.error("Your data might be in an inconsistent state. Consider restoring from a backup if issues persist.")
         raise
 
+# Migrations 1.2.1-1.2.3 only change participants.csv columns. Each is split into a check on
+# the column names and an in-memory edit, so consecutive steps can share one read and write.
+def _needs_1_2_1(columns) -> bool:
+    return "Events Waitlisted" in columns or "On General Waitlist" not in columns
+
+def _apply_1_2_1(participants_df: pd.DataFrame) -> pd.DataFrame:
+    """Add 'On General Waitlist' and drop the legacy 'Events Waitlisted' column."""
+    if "Events Waitlisted" in participants_df.columns:
+        participants_df = participants_df.drop(columns=["Events Waitlisted"])
+        st.info("Removed legacy 'Events Waitlisted' column from participants.csv.")
+    if "On General Waitlist" not in participants_df.columns:
+        participants_df["On General Waitlist"] = "No"  # Default to "No"
+        st.info("Added 'On General Waitlist' column to participants.csv (defaulted to 'No').")
+    return participants_df
+
+def _needs_1_2_2(columns) -> bool:
+    return "Tags" not in columns
+
+def _apply_1_2_2(participants_df: pd.DataFrame) -> pd.DataFrame:
+    """Add the 'Tags' column."""
+    participants_df["Tags"] = ""  # Default to empty string
+    st.info("Added 'Tags' column to participants.csv.")
+    return participants_df
+
+def _needs_1_2_3(columns) -> bool:
+    return "Nomination Notes" in columns or "Notes" not in columns or "Cohort Membership Details" in columns
+
+def _apply_1_2_3(participants_df: pd.DataFrame) -> pd.DataFrame:
+    """Rename 'Nomination Notes' to 'Notes' (adding it if absent) and drop 'Cohort Membership Details'."""
+    # Rename 'Nomination Notes' to 'Notes' if present
+    if "Nomination Notes" in participants_df.columns:
+        participants_df = participants_df.rename(columns={"Nomination Notes": "Notes"})
+        st.info("Renamed 'Nomination Notes' column to 'Notes' in participants.csv.")
+    # Add 'Notes' if not present
+    if "Notes" not in participants_df.columns:
+        participants_df["Notes"] = ""
+        st.info("Added 'Notes' column to participants.csv.")
+    # Remove 'Cohort Membership Details' if present
+    if "Cohort Membership Details" in participants_df.columns:
+        participants_df = participants_df.drop(columns=["Cohort Membership Details"])
+        st.info("Removed 'Cohort Membership Details' column from participants.csv.")
+    return participants_df
+
+def _remove_events_waitlisted_column() -> None:
+    """Remove 'Waitlisted' from events.csv if a previous incorrect 1.2.1 migration attempt added it."""
+    events_path = _path_for("events")
+    if os.path.exists(events_path):
+        try:
+            if "Waitlisted" in _csv_columns(events_path):
+                events_df = _read_csv_as_str(events_path)
+                events_df = events_df.drop(columns=["Waitlisted"])
+                _fast_to_csv(events_df, events_path)
+                st.info("Removed legacy 'Waitlisted' column from events.csv.")
+        except Exception as e:
+            st.warning(f"Could not process events.csv to remove old Waitlisted column: {e}")
+
 # Migration for version 1.2.1: Adds 'On General Waitlist' to participants
 def migrate_from_1_2_0_to_1_2_1():
     """Migration from v1.2.0 to v1.2.1:
@@ -332,35 +530,14 @@ def migrate_from_1_2_0_to_1_2_1():
     """
     st.info("Starting migration to v1.2.1 for 'On General Waitlist' feature...")
     try:
-        # Attempt to remove 'Waitlisted' from events.csv (if it exists from previous incorrect migration)
-        events_path = _path_for("events")
-        if os.path.exists(events_path):
-            try:
-                events_df = pd.read_csv(events_path, dtype=str, na_filter=False).fillna("")
-                if "Waitlisted" in events_df.columns:
-                    events_df = events_df.drop(columns=["Waitlisted"])
-                    events_df.to_csv(events_path, index=False)
-                    st.info("Removed legacy 'Waitlisted' column from events.csv.")
-            except Exception as e:
-                st.warning(f"Could not process events.csv to remove old Waitlisted column: {e}")
+        _remove_events_waitlisted_column()
 
         # Add 'On General Waitlist' to participants.csv and remove old 'Events Waitlisted'
         participants_path = _path_for("participants")
         if os.path.exists(participants_path):
-            participants_df = pd.read_csv(participants_path, dtype=str, na_filter=False).fillna("")
-            made_changes_participants = False
-            if "Events Waitlisted" in participants_df.columns:
-                participants_df = participants_df.drop(columns=["Events Waitlisted"])
-                st.info("Removed legacy 'Events Waitlisted' column from participants.csv.")
-                made_changes_participants = True
-            
-            if "On General Waitlist" not in participants_df.columns:
-                participants_df["On General Waitlist"] = "No"  # Default to "No"
-                st.info("Added 'On General Waitlist' column to participants.csv (defaulted to 'No').")
-                made_changes_participants = True
-            
-            if made_changes_participants:
-                participants_df.to_csv(participants_path, index=False)
+            if _needs_1_2_1(_csv_columns(participants_path)):
+                participants_df = _apply_1_2_1(_read_csv_as_str(participants_path))
+                _fast_to_csv(participants_df, participants_path)
         else:
             st.warning("participants.csv not found during migration 1.2.0->1.2.1. It should have been created by previous migration. If this is a fresh install, it's okay, schema will be applied on first load.")
         
@@ -379,11 +556,9 @@ def migrate_from_1_2_1_to_1_2_2():
     try:
         participants_path = _path_for("participants")
         if os.path.exists(participants_path):
-            participants_df = pd.read_csv(participants_path, dtype=str, na_filter=False).fillna("")
-            if "Tags" not in participants_df.columns:
-                participants_df["Tags"] = ""  # Default to empty string
-                participants_df.to_csv(participants_path, index=False)
-                st.info("Added 'Tags' column to participants.csv.")
+            if _needs_1_2_2(_csv_columns(participants_path)):
+                participants_df = _apply_1_2_2(_read_csv_as_str(participants_path))
+                _fast_to_csv(participants_df, participants_path)
         else:
             st.warning("participants.csv not found during migration 1.2.1->1.2.2. It should have been created by previous migrations. If this is a fresh install, it will be created with the new schema on first load.")
         
@@ -403,25 +578,9 @@ def migrate_from_1_2_2_to_1_2_3():
     try:
         participants_path = _path_for("participants")
         if os.path.exists(participants_path):
-            participants_df = pd.read_csv(participants_path, dtype=str, na_filter=False).fillna("")
-            changes_made = False
-            # Rename 'Nomination Notes' to 'Notes' if present
-            if "Nomination Notes" in participants_df.columns:
-                participants_df = participants_df.rename(columns={"Nomination Notes": "Notes"})
-                st.info("Renamed 'Nomination Notes' column to 'Notes' in participants.csv.")
-                changes_made = True
-            # Add 'Notes' if not present
-            if "Notes" not in participants_df.columns:
-                participants_df["Notes"] = ""
-                st.info("Added 'Notes' column to participants.csv.")
-                changes_made = True
-            # Remove 'Cohort Membership Details' if present
-            if "Cohort Membership Details" in participants_df.columns:
-                participants_df = participants_df.drop(columns=["Cohort Membership Details"])
-                st.info("Removed 'Cohort Membership Details' column from participants.csv.")
-                changes_made = True
-            if changes_made:
-                participants_df.to_csv(participants_path, index=False)
+            if _needs_1_2_3(_csv_columns(participants_path)):
+                participants_df = _apply_1_2_3(_read_csv_as_str(participants_path))
+                _fast_to_csv(participants_df, participants_path)
                 st.info("participants.csv updated by migration to v1.2.3")
         else:
             st.warning("participants.csv not found during migration 1.2.2->1.2.3. If this is a fresh install, it will be created with the new schema on first load.")
@@ -432,10 +591,49 @@ def migrate_from_1_2_2_to_1_2_3():
         st.error(f"Migration to v1.2.3 ('Notes', remove 'Cohort Membership Details') failed: {str(e)}")
         raise
 
+# Participants-only steps that run_migrations can fuse: key -> (extra non-participant work, column check, edit)
+PARTICIPANT_SCHEMA_STEPS = {
+    '1.2.0->1.2.1': (_remove_events_waitlisted_column, _needs_1_2_1, _apply_1_2_1),
+    '1.2.1->1.2.2': (None, _needs_1_2_2, _apply_1_2_2),
+    '1.2.2->1.2.3': (None, _needs_1_2_3, _apply_1_2_3),
+}
+
+def migrate_participants_schema_steps(step_keys: list) -> None:
+    """Apply several consecutive participants-only migrations with one read and one write of participants.csv."""
+    target_version = step_keys[-1].split('->')[1]
+    st.info(f"Starting migrations {', '.join(step_keys)} for participants.csv...")
+    try:
+        for key in step_keys:
+            extra_step = PARTICIPANT_SCHEMA_STEPS[key][0]
+            if extra_step is not None:
+                extra_step()
+
+        participants_path = _path_for("participants")
+        if os.path.exists(participants_path):
+            if any(PARTICIPANT_SCHEMA_STEPS[key][1](_csv_columns(participants_path)) for key in step_keys):
+                participants_df = _read_csv_as_str(participants_path)
+                for key in step_keys:
+                    _, needs_step, apply_step = PARTICIPANT_SCHEMA_STEPS[key]
+                    if needs_step(participants_df.columns):
+                        participants_df = apply_step(participants_df)
+                _fast_to_csv(participants_df, participants_path)
+                st.info(f"participants.csv updated by migration to v{target_version}")
+        else:
+            st.warning(f"participants.csv not found during migrations {', '.join(step_keys)}. If this is a fresh install, it will be created with the new schema on first load.")
+
+        st.success(f"Successfully migrated participants.csv to v{target_version}.")
+        load_table.clear()
+    except Exception as e:
+        st.error(f"Migrations {', '.join(step_keys)} (participants.csv columns) failed: {str(e)}")
+        raise
+
 ###############################################################################
 # Configuration
 ###############################################################################
 DATA_DIR = "data"              # Folder where CSV files live (created if needed)
+EDITOR_PAGE_SIZE = 200         # Default rows per page when a table is too large to edit in one data editor
+EDITOR_PAGE_SIZE_OPTIONS = (100, 200, 500, 1000)  # Choices offered by the "Rows per page" selector
+EDITOR_VISIBLE_ROWS = 15       # Rows the paged editor shows before it scrolls
 
 # Default column mappings for employees table
 DEFAULT_MAPPINGS = {
@@ -484,6 +682,12 @@ FILES = {
     ])
 }
 
+# Canonical columns per table, precomputed once: tuples keep the order, frozensets answer membership
+CANONICAL_COLS = {key: tuple(cols) for key, (_, cols) in FILES.items()}
+CANONICAL_COLS_SET = {key: frozenset(cols) for key, (_, cols) in FILES.items()}
+PARTICIPANTS_COLS = FILES["participants"][1]
+EMPTY_PARTICIPANT_ROW = {col: "" for col in PARTICIPANTS_COLS} # Copied for each new participant row
+
 # Event categories and their descriptions
 EVENT_CATEGORIES = {
     "Workshop": "Official workshop instance from the workshop series",
@@ -502,34 +706,190 @@ def ensure_data_dir() -> None:
     if not os.path.exists(BACKUP_DIR):
         os.makedirs(BACKUP_DIR)
 
-def log_absent_identifier(identifier: str) -> None:
-    """Logs an identifier not found in employees.csv to could_not_find.csv."""
+def log_absent_identifiers(identifiers: Iterable[str]) -> None:
+    """Logs a batch of identifiers not found in employees.csv to could_not_find.csv in one write."""
+    logged_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    rows = [(identifier, logged_at) for identifier in identifiers]
+    if not rows:
+        return
     ensure_data_dir()  # Ensure DATA_DIR exists
     log_file_path = os.path.join(DATA_DIR, "could_not_find.csv")
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    # Create a new DataFrame for the entry
-    # Ensure columns are in the correct order for concatenation if file exists
-    new_entry_df = pd.DataFrame([[identifier, now]], columns=["Identifier", "Timestamp"])
+    new_file = not os.path.exists(log_file_path)
+
+    # Plain csv.writer: no DataFrame is needed for two-column log rows
+    with open(log_file_path, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator="\n")
+        if new_file:
+            writer.writerow(["Identifier", "Timestamp"])
+        writer.writerows(rows)
+
+def _row_index_by_id(df: pd.DataFrame) -> dict:
+    """Map each Standard ID in *df* to the index label of its first row."""
+    first_rows = ~df["Standard ID"].duplicated()
+    return dict(zip(df.loc[first_rows, "Standard ID"], df.index[first_rows]))
+
+def _email_by_id(employees_df: pd.DataFrame) -> dict:
+    """Map each Standard ID in *employees_df* to the Email of its first row."""
+    first_rows = ~employees_df["Standard ID"].duplicated()
+    return dict(zip(employees_df.loc[first_rows, "Standard ID"], employees_df.loc[first_rows, "Email"]))
+
+def split_csv_field(value) -> set:
+    """Members of a comma-joined field such as "Events Registered", without blanks."""
+    return set(str(value).split(",")) - {""} if value else set()
+
+def join_csv_field(members: Iterable[str]) -> str:
+    """Comma-join *members* in sorted order, dropping blanks."""
+    return ",".join(sorted(set(members) - {""}))
+
+def add_to_csv_field(current, to_add: Iterable[str]) -> str:
+    """Return the comma-joined field *current* with *to_add* merged in."""
+    return join_csv_field(split_csv_field(current).union(to_add))
+
+def remove_from_csv_field(current, to_remove: Iterable[str]) -> str:
+    """Return the comma-joined field *current* with *to_remove* taken out."""
+    return join_csv_field(split_csv_field(current).difference(to_remove))
+
+def _frames_equal(a: pd.DataFrame, b: pd.DataFrame) -> bool:
+    """Same result as ``a.equals(b)``, but stops at the first column that differs instead of
+    comparing the whole consolidated block."""
+    if a.shape != b.shape or not a.columns.equals(b.columns) or not a.index.equals(b.index):
+        return False
+    return all(a.iloc[:, i].equals(b.iloc[:, i]) for i in range(a.shape[1]))
 
-    if not os.path.exists(log_file_path):
-        new_entry_df.to_csv(log_file_path, index=False)
-    else:
-        # Append without header
-        new_entry_df.to_csv(log_file_path, mode='a', header=False, index=False)
+def _editor_has_edits(editor_key: str) -> bool:
+    """Whether the data editor *editor_key* has recorded any edited, added or deleted rows.
+
+    st.data_editor keeps its delta against the input frame in session state, so an empty delta
+    means the editor returned its input unchanged and no frame comparison is needed.
+    """
+    delta = st.session_state.get(editor_key) or {}
+    return bool(delta.get("edited_rows") or delta.get("added_rows") or delta.get("deleted_rows"))
+
+def _editor_change_summary(editor_key: str) -> str:
+    """Describe the data editor *editor_key*'s recorded delta, e.g. "3 cell(s) changed across 2 column(s)".
+
+    Counted from the delta st.data_editor keeps in session state, so no frame comparison is needed.
+    """
+    delta = st.session_state.get(editor_key) or {}
+    edited_rows = delta.get("edited_rows") or {}
+    changed_columns = set()
+    changed_cells = 0
+    for row_changes in edited_rows.values():
+        changed_columns.update(row_changes)
+        changed_cells += len(row_changes)
+    parts = []
+    if changed_cells:
+        parts.append(f"{changed_cells} cell(s) changed across {len(changed_columns)} column(s)")
+    if delta.get("added_rows"):
+        parts.append(f"{len(delta['added_rows'])} row(s) added")
+    if delta.get("deleted_rows"):
+        parts.append(f"{len(delta['deleted_rows'])} row(s) deleted")
+    return ", ".join(parts)
+
+def _apply_cell_updates(df: pd.DataFrame, updates: dict) -> None:
+    """Write ``{column: {row label: value}}`` into *df* with one .loc assignment per column."""
+    for col, row_values in updates.items():
+        if row_values:
+            df.loc[list(row_values), col] = list(row_values.values())
 
 def _path_for(key: str) -> str:
     """Absolute CSV path for a given logical table key."""
     filename, _ = FILES[key]
     return os.path.join(DATA_DIR, filename)
 
+CSV_WRITE_BUFFER = 1 << 20  # 1 MiB write buffer for table CSVs
+
+def _fast_to_csv(df: pd.DataFrame, path: str, cols: Union[list, None] = None) -> None:
+    """Write *df* (optionally just *cols*, in that order) to *path* through one large buffered handle with "\n" line endings."""
+    with open(path, 'w', buffering=CSV_WRITE_BUFFER, newline='', encoding='utf-8') as f:
+        (df[cols] if cols is not None else df).to_csv(f, index=False, lineterminator="\n")
+
+def _read_csv_as_str(path: str) -> pd.DataFrame:
+    """Read a CSV with every column as a plain string and empty cells as "".
+
+    Uses pyarrow's multi-threaded reader with all columns typed as strings (so IDs keep
+    leading zeros and "NA" stays literal), falling back to pandas' C engine when pyarrow
+    is unavailable or cannot parse the file.
+    """
+    if pa is not None:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            header = next(csv.reader(f), None)
+        # Blank or duplicate header names are left to pandas, which renames them
+        if header and all(header) and len(set(header)) == len(header):
+            try:
+                table = pa_csv.read_csv(
+                    path,
+                    parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types={col: pa.string() for col in header},
+                        null_values=[],
+                        strings_can_be_null=False,
+                        quoted_strings_can_be_null=False,
+                    ),
+                )
+                return table.to_pandas()
+            except pa.ArrowInvalid:
+                pass
+    return pd.read_csv(
+        path,
+        dtype=str, # Initially read all as string
+        na_filter=False,
+        low_memory=True,
+        engine='c'
+    ) # na_filter=False already yields "" for empty and missing cells
+
+def _read_table_file(path: str) -> pd.DataFrame:
+    """Read a table CSV, going through its Parquet sidecar (``<name>.csv.parquet``) when current.
+
+    The sidecar records the size and exact mtime of the CSV it was built from, so any rewrite
+    of the CSV (a save, a migration or a backup restore) makes it stale and it is rebuilt on
+    the next load. The CSV remains the source of truth.
+    """
+    if pa is None:
+        return _read_csv_as_str(path)
+
+    pq_path = path + ".parquet"
+    csv_stamp = _csv_stamp(path)
+    if os.path.exists(pq_path):
+        try:
+            table = pa_pq.read_table(pq_path)
+            if (table.schema.metadata or {}).get(b"source_csv") == csv_stamp:
+                return table.to_pandas()
+        except (OSError, pa.ArrowException):
+            pass # Unreadable sidecar: rebuild it from the CSV
+
+    df = _read_csv_as_str(path)
+    _write_table_sidecar(path, df, csv_stamp)
+    return df
+
+def _csv_stamp(path: str) -> bytes:
+    """Size and exact mtime of the CSV at *path*, as recorded in its Parquet sidecar."""
+    csv_stat = os.stat(path)
+    return f"{csv_stat.st_size}:{csv_stat.st_mtime_ns}".encode()
+
+def _write_table_sidecar(path: str, df: pd.DataFrame, csv_stamp: bytes) -> None:
+    """Store *df* as the Parquet sidecar of the CSV at *path*, stamped with *csv_stamp*.
+
+    Only frames holding nothing but non-null strings under unique, non-blank headers are
+    written, since only those read back from the CSV unchanged.
+    """
+    if pa is None or len(set(df.columns)) != len(df.columns) or not all(isinstance(col, str) and col for col in df.columns):
+        return
+    try:
+        table = pa.Table.from_pandas(df, schema=pa.schema([(col, pa.string()) for col in df.columns]), preserve_index=False)
+        if any(column.null_count for column in table.columns):
+            return
+        table = table.replace_schema_metadata({b"source_csv": csv_stamp})
+        pa_pq.write_table(table, path + ".parquet", compression="snappy")
+    except (OSError, pa.ArrowException):
+        pass # The sidecar is only a cache; loading still works from the CSV
+
 def validate_and_fix_csv_schema(key: str, df: pd.DataFrame) -> tuple[pd.DataFrame, bool]:
     """Validate CSV against expected schema and fix if necessary."""
-    canonical_cols = FILES[key][1][:]  # Make a copy of expected columns
     fixed = False
     
     # Check if all expected columns exist
-    for col in canonical_cols:
+    for col in CANONICAL_COLS[key]:
         if col not in df.columns:
             df[col] = ""
             fixed = True
@@ -544,20 +904,12 @@ def load_table(key: str) -> pd.DataFrame:
     path = _path_for(key)
     # canonical_cols are the *minimum* internal columns we expect (e.g., "Standard ID", "Email")
     # plus any other columns found in the CSV for employees.
-    canonical_cols = FILES[key][1][:] # Make a copy
+    canonical_cols = list(CANONICAL_COLS[key])
 
     if os.path.exists(path):
-        df = pd.read_csv(
-            path,
-            dtype=str, # Initially read all as string
-            na_filter=False,
-            low_memory=True,
-            engine='c'
-        ).fillna("")
+        df = _read_table_file(path)
 
         if key == "employees":
-            # Force cache clear for employees table
-            load_table.clear()
             # Rename "Work Email Address" to "Email" if it exists
             if "Work Email Address" in df.columns:
                 df = df.rename(columns={"Work Email Address": "Email"})
@@ -570,9 +922,7 @@ def load_table(key: str) -> pd.DataFrame:
             
             # Dynamically add any other columns from the CSV to our list of columns to display/use
             # The initial canonical_cols for employees is ["Standard ID", "Email"]
-            for col in df.columns:
-                if col not in canonical_cols:
-                    canonical_cols.append(col)
+            canonical_cols.extend(col for col in df.columns if col not in CANONICAL_COLS_SET[key])
 
         # Special handling for date columns (for other tables)
         elif key == "events" and "Date" in df.columns:
@@ -583,12 +933,13 @@ def load_table(key: str) -> pd.DataFrame:
         # Validate and fix schema if necessary
         df, was_fixed = validate_and_fix_csv_schema(key, df)
         if was_fixed:
-            # If we had to fix the schema, save the fixed file
-            df_to_save = df.copy()
+            # If we had to fix the schema, save the fixed file. The rewritten CSV carries the
+            # added columns, so this only happens on the first load after they go missing.
+            df_to_save = df
             if key == "employees":
                 # If we were to save with external names, this is where we'd rename "Email" back
-                df_to_save = df_to_save.rename(columns={"Email": "Work Email Address"})
-            df_to_save.to_csv(path, index=False)
+                df_to_save = df.rename(columns={"Email": "Work Email Address"}) # rename already returns a new frame
+            _fast_to_csv(df_to_save, path)
 
     else: # File does not exist, create an empty one with canonical columns
         df = pd.DataFrame(columns=canonical_cols) 
@@ -600,11 +951,11 @@ def load_table(key: str) -> pd.DataFrame:
         
         # For a new employees.csv, we need to map internal "Email" back to "Work Email Address"
         # if we were to save it immediately
-        df_to_save = df.copy()
+        df_to_save = df
         if key == "employees":
              # If we were to save with external names, this is where we'd rename "Email" back
-             df_to_save = df_to_save.rename(columns={"Email": "Work Email Address"})
-        df_to_save.to_csv(path, index=False)
+             df_to_save = df.rename(columns={"Email": "Work Email Address"})
+        _fast_to_csv(df_to_save, path)
 
     # Ensure all *expected* (canonical + dynamic for employees) columns exist in the DataFrame
     # For employees, canonical_cols has already been updated with dynamic columns from CSV
@@ -625,35 +976,13 @@ def save_table(key: str, df: pd.DataFrame) -> None:
     """Persist *df* back to disk for logical table *key*."""
     path = _path_for(key)
     
-    # For employees, convert internal "Email" back to "Work Email Address" when saving
-    df_to_save = df.copy()
-    if key == "employees" and "Email" in df.columns:
-        df_to_save = df_to_save.rename(columns={"Email": "Work Email Address"})
+    # For employees, convert internal "Email" back to "Work Email Address" when saving.
+    # rename returns a new frame and writing only reads, so no defensive copy is needed.
+    df_to_save = df.rename(columns={"Email": "Work Email Address"}) if key == "employees" and "Email" in df.columns else df
         
-    df_to_save.to_csv(path, index=False)
-
-
-def get_employee_ids_from_input(input_str: str, all_employees: pd.DataFrame) -> tuple[list[str], list[str]]:
-    """Parses a string of IDs/emails, validates them, and returns valid IDs and invalids."""
-    identifiers = [item.strip() for item in input_str.strip().split('\n') if item.strip()]
-    valid_ids = set()
-    invalid_inputs = []
-
-    email_to_id = all_employees.set_index("Email")["Standard ID"]
-    id_set = set(all_employees["Standard ID"])
-
-    for identifier in identifiers:
-        if '@' in identifier: # Assume it's an email
-            if identifier in email_to_id.index:
-                valid_ids.add(email_to_id[identifier])
-            else:
-                invalid_inputs.append(identifier)
-        else: # Assume it's a Standard ID
-            if identifier in id_set:
-                valid_ids.add(identifier)
-            else:
-                invalid_inputs.append(identifier)
-    return sorted(list(valid_ids)), invalid_inputs
+    _fast_to_csv(df_to_save, path)
+    # Refresh the load cache from the frame just written so the next load skips the CSV parse
+    _write_table_sidecar(path, df_to_save, _csv_stamp(path))
 
 
 def update_employee_event_status(employee_ids_to_process: list[str], absent_ids_set: set[str], event_id: str, mark_registered: Union[bool, None], mark_participated: Union[bool, None], mark_hosted: Union[bool, None]) -> tuple[int, int, int]:
@@ -667,90 +996,76 @@ def update_employee_event_status(employee_ids_to_process: list[str], absent_ids_
     participants_df = load_table("participants")
     events_df = load_table("events")
     employees_df = load_table("employees") # Still needed for existing employees' details
-    load_table.clear()
 
-    event_row_series = events_df[events_df["Event ID"] == event_id]
-    if event_row_series.empty:
+    # Look up the row label only; filtering the frame would copy every column of the match
+    event_index_list = events_df.index[events_df["Event ID"] == event_id]
+    if event_index_list.empty:
         st.error(f"Event ID {event_id} not found in events.csv.")
         return 0, 0, 0
-    event_idx = event_row_series.index[0]
+    event_idx = event_index_list[0]
 
-    newly_registered_count = 0
-    newly_participated_count = 0
-    newly_hosted_count = 0
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     # --- Update events.csv --- 
-    event_registrations = set(str(events_df.loc[event_idx, "Registrations"]).split(',') if events_df.loc[event_idx, "Registrations"] else [])
-    event_participants = set(str(events_df.loc[event_idx, "Participants"]).split(',') if events_df.loc[event_idx, "Participants"] else [])
-    event_hosts = set(str(events_df.loc[event_idx, "Hosted"]).split(',') if events_df.loc[event_idx, "Hosted"] else [])
-
-    initial_event_reg_len = len(event_registrations - {''}) # Exclude empty string from count
-    initial_event_part_len = len(event_participants - {''})
-    initial_event_host_len = len(event_hosts - {''})
-
-
-    for emp_id in employee_ids_to_process:
-        if mark_registered is True:
-            event_registrations.add(emp_id)
-        
-        if mark_participated is True:
-            event_participants.add(emp_id)
-
-        if mark_hosted is True:
-            event_hosts.add(emp_id)
-
-    events_df.loc[event_idx, "Registrations"] = ",".join(sorted(list(filter(None, event_registrations))))
-    events_df.loc[event_idx, "Participants"] = ",".join(sorted(list(filter(None, event_participants))))
-    events_df.loc[event_idx, "Hosted"] = ",".join(sorted(list(filter(None, event_hosts))))
-    
-    # Calculate newly added counts more accurately
-    if mark_registered is True: 
-        final_event_reg_len = len(set(filter(None, str(events_df.loc[event_idx, "Registrations"]).split(','))))
-        newly_registered_count = final_event_reg_len - initial_event_reg_len
-    if mark_participated is True: 
-        final_event_part_len = len(set(filter(None, str(events_df.loc[event_idx, "Participants"]).split(','))))
-        newly_participated_count = final_event_part_len - initial_event_part_len
-    if mark_hosted is True: 
-        final_event_host_len = len(set(filter(None, str(events_df.loc[event_idx, "Hosted"]).split(','))))
-        newly_hosted_count = final_event_host_len - initial_event_host_len
-
+    # Counts come from the membership sets before joining, and the row is written in one assignment
+    event_cols = ["Registrations", "Participants", "Hosted"]
+    marked_ids = set(employee_ids_to_process) - {""}
+    event_values = []
+    event_counts = []
+    for col, marked in zip(event_cols, (mark_registered, mark_participated, mark_hosted)):
+        members = split_csv_field(events_df.at[event_idx, col])
+        if marked is True:
+            event_counts.append(len(marked_ids - members))
+            members |= marked_ids
+        else:
+            event_counts.append(0)
+        event_values.append(join_csv_field(members))
+    events_df.loc[event_idx, event_cols] = event_values
+    newly_registered_count, newly_participated_count, newly_hosted_count = event_counts
 
     # --- Update participants.csv --- 
+    # New participant rows are collected here and appended in a single concat after the loop
+    new_rows = []
+    pending_new_ids = set()
+    created_ids = []
+    created_unvalidated_ids = []
+    # Cell changes to existing rows, written column by column after the loop
+    cell_updates = {col: {} for col in ("Events Registered", "Events Participated", "Events Hosted", "Last Updated")}
+    participant_row_by_id = _row_index_by_id(participants_df)
+    employee_email_by_id = _email_by_id(employees_df)
+    # Log the identifiers missing from employees.csv in one pass, before touching any rows
+    log_absent_identifiers(i for i in employee_ids_to_process if i in absent_ids_set)
     for emp_id in employee_ids_to_process:
-        if emp_id in absent_ids_set:
-            log_absent_identifier(emp_id)
-
-        participant_indices = participants_df[participants_df["Standard ID"] == emp_id].index
-        participant_idx = -1 
-        if participant_indices.empty:
-            emp_details = employees_df[employees_df["Standard ID"] == emp_id] # Will be empty for absent IDs
-            
-            email_for_new_participant = ""
-            if "@" in emp_id: # If the emp_id itself is an email (because it wasn't found or is the identifier)
-                email_for_new_participant = emp_id
-            elif not emp_details.empty: # It's a valid ID found in employees_df
-                 email_for_new_participant = emp_details["Email"].iloc[0]
-            # If emp_id is a non-email ID not found in employees_df, email_for_new_participant remains ""
+        if emp_id in pending_new_ids:
+            continue # Row created earlier in this call already carries the event
+
+        participant_idx = participant_row_by_id.get(emp_id)
+        if participant_idx is None:
+            # If the emp_id itself is an email (because it wasn't found or is the identifier), use it;
+            # a non-email ID not found in employees_df gets an empty Email
+            email_for_new_participant = emp_id if "@" in emp_id else employee_email_by_id.get(emp_id, "")
             
             new_row_data = {col: "" for col in participants_df.columns}
             new_row_data["Standard ID"] = emp_id
             new_row_data["Email"] = email_for_new_participant
             if "Waitlist" in new_row_data: new_row_data["Waitlist"] = "No" # Default for new entries
+            if mark_registered is True: new_row_data["Events Registered"] = event_id
+            if mark_participated is True: new_row_data["Events Participated"] = event_id
+            if mark_hosted is True: new_row_data["Events Hosted"] = event_id
+            if mark_registered is True or mark_participated is True or mark_hosted is True:
+                new_row_data["Last Updated"] = current_time
             
-            participants_df = pd.concat([participants_df, pd.DataFrame([new_row_data])], ignore_index=True)
-            participant_idx = participants_df[participants_df["Standard ID"] == emp_id].index[0]
-            
+            new_rows.append(new_row_data)
+            pending_new_ids.add(emp_id)
             if emp_id in absent_ids_set:
-                st.info(f"Created new entry in participants.csv for unvalidated identifier: {emp_id}")
+                created_unvalidated_ids.append(emp_id)
             else:
-                st.info(f"Created new entry in participants.csv for {emp_id}")
-        else:
-            participant_idx = participant_indices[0]
+                created_ids.append(emp_id)
+            continue
 
-        emp_events_registered = set(str(participants_df.loc[participant_idx, "Events Registered"]).split(',') if participants_df.loc[participant_idx, "Events Registered"] else [])
-        emp_events_participated = set(str(participants_df.loc[participant_idx, "Events Participated"]).split(',') if participants_df.loc[participant_idx, "Events Participated"] else [])
-        emp_events_hosted = set(str(participants_df.loc[participant_idx, "Events Hosted"]).split(',') if participants_df.loc[participant_idx, "Events Hosted"] else [])
+        emp_events_registered = split_csv_field(participants_df.at[participant_idx, "Events Registered"])
+        emp_events_participated = split_csv_field(participants_df.at[participant_idx, "Events Participated"])
+        emp_events_hosted = split_csv_field(participants_df.at[participant_idx, "Events Hosted"])
 
         action_taken_on_participant_record = False
         if mark_registered is True and event_id not in emp_events_registered: 
@@ -762,12 +1077,20 @@ def update_employee_event_status(employee_ids_to_process: list[str], absent_ids_
         if mark_hosted is True and event_id not in emp_events_hosted: 
             emp_events_hosted.add(event_id); action_taken_on_participant_record = True
 
-        participants_df.loc[participant_idx, "Events Registered"] = ",".join(sorted(list(filter(None, emp_events_registered))))
-        participants_df.loc[participant_idx, "Events Participated"] = ",".join(sorted(list(filter(None, emp_events_participated))))
-        participants_df.loc[participant_idx, "Events Hosted"] = ",".join(sorted(list(filter(None, emp_events_hosted))))
+        cell_updates["Events Registered"][participant_idx] = join_csv_field(emp_events_registered)
+        cell_updates["Events Participated"][participant_idx] = join_csv_field(emp_events_participated)
+        cell_updates["Events Hosted"][participant_idx] = join_csv_field(emp_events_hosted)
         
         if action_taken_on_participant_record:
-            participants_df.loc[participant_idx, "Last Updated"] = current_time
+            cell_updates["Last Updated"][participant_idx] = current_time
+
+    _apply_cell_updates(participants_df, cell_updates)
+    if new_rows:
+        participants_df = pd.concat([participants_df, pd.DataFrame(new_rows, columns=participants_df.columns)], ignore_index=True)
+    if created_ids:
+        st.info(f"Created new entries in participants.csv for: {', '.join(created_ids)}")
+    if created_unvalidated_ids:
+        st.info(f"Created new entries in participants.csv for unvalidated identifiers: {', '.join(created_unvalidated_ids)}")
 
     save_table("events", events_df)
     save_table("participants", participants_df)
@@ -796,127 +1119,86 @@ def update_cohort_membership(cohort_name: str, employee_ids_to_process: list[str
         return 0, 0, 0
     cohort_idx = cohort_index_list[0]
 
-    added_nominees_count = 0
-    added_invited_count = 0
-    added_joined_count = 0
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    employee_id_set = frozenset(employee_ids_to_process) # Built once for the membership removals below
     
     # --- Update cohorts.csv --- 
-    if mark_nominated:
-        current_cohort_nominees = set(str(cohorts_df.loc[cohort_idx, "Nominated"]).split(',') if cohorts_df.loc[cohort_idx, "Nominated"] else [])
-        initial_len = len(current_cohort_nominees - {''})
-        if action_type == "add":
-            current_cohort_nominees.update(employee_ids_to_process)
-        else: # remove
-            current_cohort_nominees = current_cohort_nominees - set(employee_ids_to_process)
-        cohorts_df.loc[cohort_idx, "Nominated"] = ",".join(sorted(list(filter(None, current_cohort_nominees))))
-        if action_type == "add":
-            added_nominees_count = len(set(filter(None, current_cohort_nominees))) - initial_len
-        else:
-            added_nominees_count = initial_len - len(set(filter(None, current_cohort_nominees)))
-
-    if mark_invited:
-        current_cohort_invited = set(str(cohorts_df.loc[cohort_idx, "Invited"]).split(',') if cohorts_df.loc[cohort_idx, "Invited"] else [])
-        initial_len_inv = len(current_cohort_invited - {''})
-        if action_type == "add":
-            current_cohort_invited.update(employee_ids_to_process)
-        else: # remove
-            current_cohort_invited = current_cohort_invited - set(employee_ids_to_process)
-        cohorts_df.loc[cohort_idx, "Invited"] = ",".join(sorted(list(filter(None, current_cohort_invited))))
-        if action_type == "add":
-            added_invited_count = len(set(filter(None, current_cohort_invited))) - initial_len_inv
-        else:
-            added_invited_count = initial_len_inv - len(set(filter(None, current_cohort_invited)))
-
-    if mark_joined:
-        current_cohort_joined = set(str(cohorts_df.loc[cohort_idx, "Joined"]).split(',') if cohorts_df.loc[cohort_idx, "Joined"] else [])
-        initial_len_join = len(current_cohort_joined - {''})
+    cohort_counts = {"Nominated": 0, "Invited": 0, "Joined": 0}
+    for marked, col in ((mark_nominated, "Nominated"), (mark_invited, "Invited"), (mark_joined, "Joined")):
+        if not marked:
+            continue
+        current_members = cohorts_df.at[cohort_idx, col]
         if action_type == "add":
-            current_cohort_joined.update(employee_ids_to_process)
+            updated_members = add_to_csv_field(current_members, employee_ids_to_process)
         else: # remove
-            current_cohort_joined = current_cohort_joined - set(employee_ids_to_process)
-        cohorts_df.loc[cohort_idx, "Joined"] = ",".join(sorted(list(filter(None, current_cohort_joined))))
-        if action_type == "add":
-            added_joined_count = len(set(filter(None, current_cohort_joined))) - initial_len_join
-        else:
-            added_joined_count = initial_len_join - len(set(filter(None, current_cohort_joined)))
+            updated_members = remove_from_csv_field(current_members, employee_id_set)
+        cohorts_df.at[cohort_idx, col] = updated_members
+        # Adds only grow the list and removals only shrink it, so the size change is the count
+        cohort_counts[col] = abs(len(split_csv_field(updated_members)) - len(split_csv_field(current_members)))
+    added_nominees_count = cohort_counts["Nominated"]
+    added_invited_count = cohort_counts["Invited"]
+    added_joined_count = cohort_counts["Joined"]
 
     # --- Update participants.csv ---
     participants_file_updated = False
+    # New participant rows are collected here and appended in a single concat after the loop
+    new_rows = []
+    pending_new_ids = set()
+    created_ids = []
+    created_unvalidated_ids = []
+    # Cell changes to existing rows, written column by column after the loop
+    cell_updates = {col: {} for col in ("Cohorts Nominated", "Cohorts Invited", "Cohorts Joined", "Nominated By", "Notes", "Last Updated")}
+    participant_row_by_id = _row_index_by_id(participants_df)
+    employee_email_by_id = _email_by_id(employees_df)
+    # Nominators are parsed once here rather than for every participant row
+    requested_nominators = [n for n in dict.fromkeys(x.strip() for x in nominated_by_details.split(",")) if n]
+    new_participant_nominated_by = ", ".join(sorted({n for n in requested_nominators if n.lower() != 'nan'}))
+    # Log the identifiers missing from employees.csv in one pass, before touching any rows
+    log_absent_identifiers(i for i in employee_ids_to_process if i in absent_ids_set)
     for emp_id in employee_ids_to_process:
-        if emp_id in absent_ids_set:
-            log_absent_identifier(emp_id)
-
-        participant_indices = participants_df[participants_df["Standard ID"] == emp_id].index
-        if not participant_indices.empty:
-            participant_idx = participant_indices[0]
+        if emp_id in pending_new_ids:
+            continue # Row created earlier in this call already carries the cohort details
+        participant_idx = participant_row_by_id.get(emp_id)
+        if participant_idx is not None:
             participant_row_changed = False
             action_taken_for_cohort = False
 
-            if mark_nominated:
-                emp_cohorts_nominated = set(str(participants_df.loc[participant_idx, "Cohorts Nominated"]).split(',') if participants_df.loc[participant_idx, "Cohorts Nominated"] else [])
-                if action_type == "add" and cohort_name not in emp_cohorts_nominated:
-                    emp_cohorts_nominated.add(cohort_name)
-                    participants_df.loc[participant_idx, "Cohorts Nominated"] = ",".join(sorted(list(filter(None, emp_cohorts_nominated))))
-                    participant_row_changed = True
-                elif action_type == "remove" and cohort_name in emp_cohorts_nominated:
-                    emp_cohorts_nominated.remove(cohort_name)
-                    participants_df.loc[participant_idx, "Cohorts Nominated"] = ",".join(sorted(list(filter(None, emp_cohorts_nominated))))
-                    participant_row_changed = True
-                action_taken_for_cohort = True 
-            
-            if mark_invited:
-                emp_cohorts_invited = set(str(participants_df.loc[participant_idx, "Cohorts Invited"]).split(',') if participants_df.loc[participant_idx, "Cohorts Invited"] else [])
-                if action_type == "add" and cohort_name not in emp_cohorts_invited:
-                    emp_cohorts_invited.add(cohort_name)
-                    participants_df.loc[participant_idx, "Cohorts Invited"] = ",".join(sorted(list(filter(None, emp_cohorts_invited))))
-                    participant_row_changed = True
-                elif action_type == "remove" and cohort_name in emp_cohorts_invited:
-                    emp_cohorts_invited.remove(cohort_name)
-                    participants_df.loc[participant_idx, "Cohorts Invited"] = ",".join(sorted(list(filter(None, emp_cohorts_invited))))
-                    participant_row_changed = True
-                action_taken_for_cohort = True
-
-            if mark_joined:
-                emp_cohorts_joined = set(str(participants_df.loc[participant_idx, "Cohorts Joined"]).split(',') if participants_df.loc[participant_idx, "Cohorts Joined"] else [])
-                if action_type == "add" and cohort_name not in emp_cohorts_joined:
-                    emp_cohorts_joined.add(cohort_name)
-                    participants_df.loc[participant_idx, "Cohorts Joined"] = ",".join(sorted(list(filter(None, emp_cohorts_joined))))
+            for marked, col in ((mark_nominated, "Cohorts Nominated"), (mark_invited, "Cohorts Invited"), (mark_joined, "Cohorts Joined")):
+                if not marked:
+                    continue
+                emp_cohorts = split_csv_field(participants_df.at[participant_idx, col])
+                if action_type == "add" and cohort_name not in emp_cohorts:
+                    cell_updates[col][participant_idx] = join_csv_field(emp_cohorts | {cohort_name})
                     participant_row_changed = True
-                elif action_type == "remove" and cohort_name in emp_cohorts_joined:
-                    emp_cohorts_joined.remove(cohort_name)
-                    participants_df.loc[participant_idx, "Cohorts Joined"] = ",".join(sorted(list(filter(None, emp_cohorts_joined))))
+                elif action_type == "remove" and cohort_name in emp_cohorts:
+                    cell_updates[col][participant_idx] = join_csv_field(emp_cohorts - {cohort_name})
                     participant_row_changed = True
                 action_taken_for_cohort = True
             
             if action_taken_for_cohort and nominated_by_details and action_type == "add": # Only add nominated_by details when adding
-                nominated_by_list = [x.strip() for x in str(participants_df.loc[participant_idx, "Nominated By"]).split(",") if x.strip()]
-                if nominated_by_details not in nominated_by_list: # Only add if new
-                    nominated_by_list.append(nominated_by_details)
-                    participants_df.loc[participant_idx, "Nominated By"] = ", ".join(sorted(list(filter(None, nominated_by_list))))
+                nominated_by_list = [x.strip() for x in str(participants_df.at[participant_idx, "Nominated By"]).split(",") if x.strip()]
+                nominated_by_set = set(nominated_by_list)
+                nominators_to_add = [n for n in requested_nominators if n not in nominated_by_set]
+                if nominators_to_add: # Only add nominators not already recorded
+                    nominated_by_list.extend(nominators_to_add)
+                    cell_updates["Nominated By"][participant_idx] = ", ".join(sorted(nominated_by_list))
                     participant_row_changed = True
             
             # Update notes if notes_details are provided and a cohort action was taken for this user
             if action_taken_for_cohort and notes_details and action_type == "add": # Only add notes when adding
-                current_notes = str(participants_df.loc[participant_idx, "Notes"])
+                current_notes = str(participants_df.at[participant_idx, "Notes"])
                 if notes_details not in current_notes:
                     updated_notes = f"{current_notes}\n{notes_details}".strip() if current_notes else notes_details
-                    participants_df.loc[participant_idx, "Notes"] = updated_notes
+                    cell_updates["Notes"][participant_idx] = updated_notes
                     participant_row_changed = True
 
             if participant_row_changed:
-                participants_df.loc[participant_idx, "Last Updated"] = current_time
+                cell_updates["Last Updated"][participant_idx] = current_time
                 participants_file_updated = True
         else:
             # Only create new participant entries when adding, not when removing
             if action_type == "add":
-                emp_details = employees_df[employees_df["Standard ID"] == emp_id]
-                
-                email_for_new_participant = ""
-                if "@" in emp_id:
-                    email_for_new_participant = emp_id
-                elif not emp_details.empty:
-                    email_for_new_participant = emp_details["Email"].iloc[0]
+                email_for_new_participant = emp_id if "@" in emp_id else employee_email_by_id.get(emp_id, "")
 
                 new_row_data = {col: "" for col in participants_df.columns}
                 new_row_data["Standard ID"] = emp_id
@@ -941,27 +1223,35 @@ def update_cohort_membership(cohort_name: str, employee_ids_to_process: list[str
                     action_taken_for_new_participant_cohort = True
                 
                 if action_taken_for_new_participant_cohort and nominated_by_details:
-                    nominators_for_new = set(e.strip() for e in nominated_by_details.split(',') if e.strip() and e.strip().lower() != 'nan')
-                    temp_nominated_by_string = ", ".join(sorted(list(n for n in nominators_for_new if n)))
+                    temp_nominated_by_string = new_participant_nominated_by
                 
                 if action_taken_for_new_participant_cohort and notes_details:
                     temp_notes = notes_details
 
-                new_row_data["Cohorts Nominated"] = ",".join(sorted(list(filter(None, temp_emp_cohorts_nominated))))
-                new_row_data["Cohorts Invited"] = ",".join(sorted(list(filter(None, temp_emp_cohorts_invited))))
-                new_row_data["Cohorts Joined"] = ",".join(sorted(list(filter(None, temp_emp_cohorts_joined))))
+                new_row_data["Cohorts Nominated"] = join_csv_field(temp_emp_cohorts_nominated)
+                new_row_data["Cohorts Invited"] = join_csv_field(temp_emp_cohorts_invited)
+                new_row_data["Cohorts Joined"] = join_csv_field(temp_emp_cohorts_joined)
                 new_row_data["Nominated By"] = temp_nominated_by_string
                 new_row_data["Notes"] = temp_notes
                 new_row_data["Last Updated"] = current_time
                 
-                participants_df = pd.concat([participants_df, pd.DataFrame([new_row_data])], ignore_index=True)
+                new_rows.append(new_row_data)
+                pending_new_ids.add(emp_id)
                 
                 if emp_id in absent_ids_set:
-                    st.info(f"Created new entry in participants.csv for unvalidated identifier {emp_id} while updating cohort '{cohort_name}'.")
+                    created_unvalidated_ids.append(emp_id)
                 else:
-                    st.info(f"Created new entry in participants.csv for {emp_id} while updating cohort '{cohort_name}'.")
+                    created_ids.append(emp_id)
                 participants_file_updated = True
 
+    _apply_cell_updates(participants_df, cell_updates)
+    if new_rows:
+        participants_df = pd.concat([participants_df, pd.DataFrame(new_rows, columns=participants_df.columns)], ignore_index=True)
+    if created_ids:
+        st.info(f"Created new entries in participants.csv for {', '.join(created_ids)} while updating cohort '{cohort_name}'.")
+    if created_unvalidated_ids:
+        st.info(f"Created new entries in participants.csv for unvalidated identifiers {', '.join(created_unvalidated_ids)} while updating cohort '{cohort_name}'.")
+
     print(f"DEBUG: Saving cohorts.csv for cohort '{cohort_name}'")
     save_table("cohorts", cohorts_df)
     if participants_file_updated:
@@ -974,6 +1264,50 @@ def update_cohort_membership(cohort_name: str, employee_ids_to_process: list[str
     return added_nominees_count, added_invited_count, added_joined_count
 
 
+@st.fragment
+def backup_controls() -> None:
+    """Backup and restore widgets for the System section.
+
+    Runs as a fragment, so creating a backup or browsing the list reruns only this block
+    instead of the whole page with its data editors; a restore still reruns the full app.
+    """
+    if st.button("Create Backup Now", key="create_backup_btn"):
+        backup_path = create_backup()
+        if backup_path:
+            st.success(f"Backup created at: {backup_path}")
+        else:
+            st.error("Failed to create backup")
+
+    # List available backups only once asked for, so reruns elsewhere skip the scan and restore widgets
+    if st.toggle("Show available backups", key="sys_open"):
+        if os.path.exists(BACKUP_DIR):
+            backups = _list_backups(os.stat(BACKUP_DIR).st_mtime_ns)  # Most recent first
+            if backups:
+                selected_backup = st.selectbox("Available Backups", options=backups, key="backup_select")
+                if st.button("Restore Selected Backup", key="restore_backup_btn"):
+                    backup_path = os.path.join(BACKUP_DIR, selected_backup)
+                    # Confirm before restoring
+                    confirm = st.checkbox("I understand this will overwrite current data", key="confirm_restore")
+                    if confirm and st.button("Confirm Restore", key="confirm_restore_btn"):
+                        # Create a backup of current data before restoring
+                        create_backup()
+                        # Copy files from backup to data directory
+                        with os.scandir(backup_path) as entries:
+                            csv_entries = [e for e in entries if e.name.endswith('.csv') and e.is_file()]
+                        if csv_entries:
+                            with ThreadPoolExecutor(max_workers=min(8, len(csv_entries))) as executor:
+                                list(executor.map(
+                                    lambda entry: _copy_file(entry.path, os.path.join(DATA_DIR, entry.name)),
+                                    csv_entries
+                                ))
+                        st.success("Backup restored successfully!")
+                        # Clear cache to reload data
+                        load_table.clear()
+                        st.rerun()
+            else:
+                st.info("No backups available")
+
+
 ###############################################################################
 # Streamlit UI
 ###############################################################################
@@ -991,6 +1325,9 @@ if current_schema_version != APP_VERSION:
         st.warning(f"No migration path found from v{current_schema_version} to v{APP_VERSION}. " +
                   "The app will try to continue, but you may encounter issues.")
 
+# Workshops are shared by the sidebar event form, the Events tab and Settings; load them once per rerun
+workshop_df = load_table("workshops")
+
 # Main view tabs for frequently accessed tables
 main_tab1, main_tab2, main_tab3, settings_tab = st.tabs(["Participants", "Events", "Cohorts", "Settings"])
 
@@ -1007,8 +1344,11 @@ with st.sidebar:
         if events_df_local.empty:
             st.warning("No events found. Please add events first.")
         else:
-            event_options = {f"{row['Event ID']} - {row['Name']} ({pd.to_datetime(row['Date']).strftime('%Y-%m-%d') if pd.notna(row['Date']) else 'No Date'})": row['Event ID']
-                            for _, row in events_df_local.sort_values("Date", ascending=False).iterrows()}
+            # Option labels are built column-wise: one date conversion for all events instead of one per row
+            sorted_events = events_df_local.sort_values("Date", ascending=False)
+            event_dates = pd.to_datetime(sorted_events["Date"], errors="coerce").dt.strftime("%Y-%m-%d").fillna("No Date")
+            event_labels = sorted_events["Event ID"].astype(str) + " - " + sorted_events["Name"].astype(str) + " (" + event_dates + ")"
+            event_options = dict(zip(event_labels, sorted_events["Event ID"]))
             
             selected_event_display = st.selectbox(
                 "Select Event",
@@ -1043,10 +1383,10 @@ with st.sidebar:
         event_date = st.date_input("Event Date")
         event_category = st.selectbox("Category", options=list(EVENT_CATEGORIES.keys()), help="Select the type of event")
         
-        workshop_df_form = load_table("workshops")
-        form_workshop_options = [f"{row['Workshop #']} - {row['Skill']}: {row['Goal']}" for _, row in workshop_df_form.iterrows()]
-        form_workshop_options.insert(0, "")
-        selected_workshop_display = st.selectbox("Workshop (if applicable)", options=form_workshop_options, help="Select the workshop this event is an instance of (if applicable)") if event_category == "Workshop" else ""
+        selected_workshop_display = ""
+        if event_category == "Workshop":
+            form_workshop_options = [""] + (workshop_df["Workshop #"].astype(str) + " - " + workshop_df["Skill"].astype(str) + ": " + workshop_df["Goal"].astype(str)).tolist()
+            selected_workshop_display = st.selectbox("Workshop (if applicable)", options=form_workshop_options, help="Select the workshop this event is an instance of (if applicable)")
         selected_workshop_id = selected_workshop_display.split(" - ")[0] if selected_workshop_display and " - " in selected_workshop_display else ""
         
         if st.button("Add Event", key="add_event_btn"):
@@ -1072,10 +1412,10 @@ with st.sidebar:
         elif employees_df_local_cohorts.empty:
             st.warning("No employees found in Employees table. Please add employees in the 'Employees' section first.")
         else:
-            cohort_options = {row['Name']: row['Name'] for _, row in cohorts_df_local.iterrows()}
+            cohort_options = list(dict.fromkeys(cohorts_df_local["Name"])) # Unique names, first-seen order
             selected_cohort_name = st.selectbox(
                 "Select Cohort",
-                options=list(cohort_options.keys()),
+                options=cohort_options,
                 key="selected_cohort_name_for_mgmt"
             )
             st.markdown("#### Select Employees")
@@ -1101,7 +1441,7 @@ with st.sidebar:
                 added_nom, added_invited, added_joined = update_cohort_membership(
                     selected_cohort_name,
                     employee_ids_for_cohort,
-                    set(absent_cohort_ids),
+                    frozenset(absent_cohort_ids),
                     mark_nominated_cohort,
                     mark_invited_cohort,
                     mark_joined_cohort,
@@ -1150,11 +1490,13 @@ with main_tab1:
             "Last Updated": st.column_config.TextColumn("Last Updated", disabled=True)
         }
 
-        for col_key in FILES["participants"][1]:
+        for col_key in PARTICIPANTS_COLS:
             if col_key not in participants_df.columns:
                 participants_df[col_key] = ""
         
-        participants_df_for_editor = participants_df[FILES["participants"][1]].copy()
+        participants_df_for_editor = participants_df[PARTICIPANTS_COLS].copy()
+        # The checkbox column edits booleans; "Yes"/"No" is only the on-disk form
+        participants_df_for_editor["Waitlist"] = participants_df_for_editor["Waitlist"].astype(str).str.strip().str.lower().eq("yes")
 
         edited_participants_df = st.data_editor(
             participants_df_for_editor,
@@ -1165,11 +1507,40 @@ with main_tab1:
         )
 
         if st.button("💾 Save", key="save_participants"):
-            current_participants_on_disk = load_table("participants")
+            # The frame loaded for this rerun is what is on disk; reuse it instead of unpickling another copy
+            current_participants_on_disk = participants_df
+            now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S") # One timestamp for every row touched by this save
             existing_ids_on_disk = set(current_participants_on_disk["Standard ID"])
             changes_detected = False
             processed_ids_from_editor = set()
+            # Resolve rows through hashed lookups instead of scanning both tables per edited row
+            disk_row_by_id = _row_index_by_id(current_participants_on_disk)
+            employee_row_by_id = _row_index_by_id(employees_df)
+
+            # Rows already on disk: compare and write each editable column in one vectorized pass
+            edited_existing = edited_participants_df[edited_participants_df["Standard ID"].isin(disk_row_by_id.keys())]
+            edited_existing = edited_existing.drop_duplicates(subset="Standard ID", keep="last")
+            target_rows = edited_existing["Standard ID"].map(disk_row_by_id).to_numpy()
+            rows_changed = np.zeros(len(target_rows), dtype=bool)
+            for col in ("Nominated By", "Notes", "Tags"):
+                editor_values = edited_existing[col].to_numpy()
+                col_changed = current_participants_on_disk.loc[target_rows, col].to_numpy() != editor_values
+                current_participants_on_disk.loc[target_rows[col_changed], col] = editor_values[col_changed]
+                rows_changed |= col_changed
+
+            # Handle 'Waitlist' checkbox state
+            waitlist_on_disk = current_participants_on_disk.loc[target_rows, "Waitlist"].astype(str).str.strip().str.lower().eq("yes").to_numpy()
+            waitlist_in_editor = edited_existing["Waitlist"].astype(bool).to_numpy()
+            waitlist_changed = waitlist_on_disk != waitlist_in_editor
+            current_participants_on_disk.loc[target_rows[waitlist_changed], "Waitlist"] = np.where(waitlist_in_editor[waitlist_changed], "Yes", "No")
+            rows_changed |= waitlist_changed
+
+            if rows_changed.any():
+                current_participants_on_disk.loc[target_rows[rows_changed], "Last Updated"] = now_str
+                changes_detected = True
 
+            # Rows added in the editor are collected here and appended in a single concat after the loop
+            pending_new_rows = []
             for idx_edited, edited_row in edited_participants_df.iterrows():
                 std_id = edited_row["Standard ID"]
                 processed_ids_from_editor.add(std_id)
@@ -1177,62 +1548,32 @@ with main_tab1:
                 if not std_id:
                     st.warning(f"Skipping row {idx_edited + 1} in editor: Standard ID is missing. New participants should ideally be sourced from the Employees table.")
                     continue
-                
-                original_row_series_matches = current_participants_on_disk[current_participants_on_disk["Standard ID"] == std_id]
-                row_changed_in_editor = False
-
-                if not original_row_series_matches.empty:
-                    original_row_idx = original_row_series_matches.index[0]
-                    # Compare editable fields
-                    if current_participants_on_disk.loc[original_row_idx, "Nominated By"] != edited_row["Nominated By"]:
-                        current_participants_on_disk.loc[original_row_idx, "Nominated By"] = edited_row["Nominated By"]
-                        row_changed_in_editor = True
-                    
-                    if current_participants_on_disk.loc[original_row_idx, "Notes"] != edited_row["Notes"]:
-                        current_participants_on_disk.loc[original_row_idx, "Notes"] = edited_row["Notes"]
-                        row_changed_in_editor = True
-                    
-                    # Handle 'Waitlist' checkbox state
-                    current_waitlist_status_str = str(current_participants_on_disk.loc[original_row_idx, "Waitlist"]).lower() == "yes"
-                    editor_waitlist_status_bool = bool(edited_row["Waitlist"])
-                    if current_waitlist_status_str != editor_waitlist_status_bool:
-                        current_participants_on_disk.loc[original_row_idx, "Waitlist"] = "Yes" if editor_waitlist_status_bool else "No"
-                        row_changed_in_editor = True
-                    
-                    # Handle 'Tags'
-                    if current_participants_on_disk.loc[original_row_idx, "Tags"] != edited_row["Tags"]:
-                        current_participants_on_disk.loc[original_row_idx, "Tags"] = edited_row["Tags"]
-                        row_changed_in_editor = True
-
-                    if row_changed_in_editor:
-                        current_participants_on_disk.loc[original_row_idx, "Last Updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        changes_detected = True
-                else:
-                    # New row added in the editor
-                    if not edited_row["Email"] and std_id:
-                        emp_match = employees_df[employees_df["Standard ID"] == std_id]
-                        if not emp_match.empty:
-                            edited_row["Email"] = emp_match["Email"].iloc[0]
-                        else:
-                            st.warning(f"New participant ID {std_id} added in editor, but not found in Employees table to fetch Email.")
-                    
-                    new_row_data = {col: "" for col in FILES["participants"][1]}
-                    for col_name in FILES["participants"][1]:
-                        if col_name in edited_row:
-                            new_row_data[col_name] = edited_row[col_name]
-                    # Ensure 'Waitlist' from editor is correctly converted for new row
-                    new_row_data["Waitlist"] = "Yes" if bool(edited_row.get("Waitlist", False)) else "No"
-                    new_row_data["Tags"] = edited_row.get("Tags", "")
-                    new_row_data["Notes"] = edited_row.get("Notes", "")
-                    new_row_data["Last Updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    
-                    current_participants_on_disk = pd.concat([current_participants_on_disk, pd.DataFrame([new_row_data])], ignore_index=True)
-                    
-                    if emp_id in absent_ids_set:
-                        st.info(f"Created new entry in participants.csv for unvalidated identifier {emp_id} while updating cohort '{cohort_name}'.")
+
+                if std_id in disk_row_by_id:
+                    continue # Already applied in the vectorized pass above
+
+                # New row added in the editor
+                if not edited_row["Email"] and std_id:
+                    emp_row_idx = employee_row_by_id.get(std_id)
+                    if emp_row_idx is not None:
+                        edited_row["Email"] = employees_df.at[emp_row_idx, "Email"]
                     else:
-                        st.info(f"Created new entry in participants.csv for {emp_id} while updating cohort '{cohort_name}'.")
-                    changes_detected = True
+                        st.warning(f"New participant ID {std_id} added in editor, but not found in Employees table to fetch Email.")
+                
+                new_row_data = EMPTY_PARTICIPANT_ROW.copy()
+                new_row_data.update((col_name, edited_row[col_name]) for col_name in PARTICIPANTS_COLS if col_name in edited_row)
+                # Ensure 'Waitlist' from editor is correctly converted for new row
+                new_row_data["Waitlist"] = "Yes" if bool(edited_row.get("Waitlist", False)) else "No"
+                new_row_data["Tags"] = edited_row.get("Tags", "")
+                new_row_data["Notes"] = edited_row.get("Notes", "")
+                new_row_data["Last Updated"] = now_str
+                
+                pending_new_rows.append(new_row_data)
+                changes_detected = True
+
+            if pending_new_rows:
+                current_participants_on_disk = pd.concat([current_participants_on_disk, pd.DataFrame(pending_new_rows, columns=PARTICIPANTS_COLS)], ignore_index=True)
+                st.info(f"Added {len(pending_new_rows)} participant(s) via editor: {', '.join(row['Standard ID'] for row in pending_new_rows)}")
 
             deleted_ids = existing_ids_on_disk - processed_ids_from_editor
             if deleted_ids:
@@ -1241,7 +1582,7 @@ with main_tab1:
                 st.info(f"Removed {len(deleted_ids)} participant(s) via editor: {', '.join(deleted_ids)}")
 
             if changes_detected:
-                save_table("participants", current_participants_on_disk[FILES["participants"][1]])
+                save_table("participants", current_participants_on_disk[PARTICIPANTS_COLS])
                 st.success("Participant details saved successfully!")
                 load_table.clear()
                 st.rerun()
@@ -1257,12 +1598,10 @@ with main_tab2:
     
     if not events_df.empty:
         # Prepare column configurations for Events data_editor
-        workshop_df_for_options = load_table("workshops")
-        
         # Use actual Workshop # IDs for the SelectboxColumn options
         valid_workshop_ids = [""] # Start with a blank option for "no workshop"
-        if not workshop_df_for_options.empty:
-            valid_workshop_ids.extend(workshop_df_for_options["Workshop #"].unique().tolist())
+        if not workshop_df.empty:
+            valid_workshop_ids.extend(workshop_df["Workshop #"].unique().tolist())
 
         column_config_events = {
             "Workshop": st.column_config.SelectboxColumn(
@@ -1284,9 +1623,9 @@ with main_tab2:
         )
 
         if st.button("💾 Save", key="save_events"):
-            if not events_df.equals(edited_events_df):
+            if _editor_has_edits("editor_events") and not _frames_equal(events_df, edited_events_df):
                 save_table("events", edited_events_df)
-                st.success("Events saved successfully!")
+                st.success(f"Events saved successfully! ({_editor_change_summary('editor_events')})")
                 load_table.clear()
                 st.rerun()
             else:
@@ -1313,9 +1652,9 @@ with main_tab3:
         )
 
         if st.button("💾 Save", key="save_cohorts"):
-            if not cohorts_df.equals(edited_cohorts_df):
+            if _editor_has_edits("editor_cohorts") and not _frames_equal(cohorts_df, edited_cohorts_df):
                 save_table("cohorts", edited_cohorts_df)
-                st.success("Cohorts saved successfully!")
+                st.success(f"Cohorts saved successfully! ({_editor_change_summary('editor_cohorts')})")
                 load_table.clear()
                 st.rerun()
             else:
@@ -1333,7 +1672,7 @@ with settings_tab:
     
     if not employees_df.empty:
         # For employees table, allow toggling display of dynamic columns
-        displayed_columns = FILES["employees"][1][:] # Start with core internal columns
+        displayed_columns = ["Standard ID", "Email"] # Core internal columns, always first
         
         # df already contains all columns from CSV, including dynamic ones.
         # FILES["employees"][1] is just ["Standard ID", "Email"]
@@ -1349,29 +1688,68 @@ with settings_tab:
                     options=optional_columns,
                     default=[] # Initially, only show Standard ID and Email
                 )
+                # Selected columns follow the core ones in the order they were picked; the options
+                # exclude the core columns and a multiselect never repeats a choice
                 displayed_columns.extend(selected_optional_cols)
-        
-        # Ensure Standard ID and Email are always first and present
-        if "Email" not in displayed_columns:
-            displayed_columns.insert(0, "Email")
-        if "Standard ID" not in displayed_columns:
-            displayed_columns.insert(0, "Standard ID")
-        # Remove duplicates and maintain order
-        displayed_columns = sorted(list(set(displayed_columns)), key=lambda x: (x != "Standard ID", x != "Email", x))
 
+        # Large tables are edited one page at a time; the page bounds are computed once per rerun
+        df_for_display = employees_df if list(employees_df.columns) == displayed_columns else employees_df[displayed_columns]
+        n_rows = len(df_for_display)
+        start_idx, end_idx = 0, n_rows
+        page_size = EDITOR_PAGE_SIZE
+        if n_rows > EDITOR_PAGE_SIZE_OPTIONS[0]:
+            page_size = st.selectbox(
+                "Rows per page", EDITOR_PAGE_SIZE_OPTIONS,
+                index=EDITOR_PAGE_SIZE_OPTIONS.index(EDITOR_PAGE_SIZE), key="employees_page_size"
+            )
+        if n_rows > page_size:
+            total_pages = (n_rows - 1) // page_size + 1
+            page_number = st.number_input("Page", min_value=1, max_value=total_pages, value=1, step=1, key="employees_page")
+            start_idx = (page_number - 1) * page_size
+            end_idx = min(start_idx + page_size, n_rows)
+            st.caption(f"Showing rows {start_idx + 1}-{end_idx} of {n_rows}")
+        df_display_paginated = df_for_display.iloc[start_idx:end_idx]
+
+        # A fixed height keeps the grid virtualized: only the visible rows are drawn in the browser
         edited_employees_df = st.data_editor(
-            employees_df[displayed_columns], num_rows="dynamic", key="editor_employees",
-            use_container_width=True
+            df_display_paginated, num_rows="dynamic", key="editor_employees",
+            use_container_width=True, height=(min(len(df_display_paginated), EDITOR_VISIBLE_ROWS) + 2) * 35
         )
 
         if st.button("💾 Save", key="save_employees"):
-            if not employees_df[displayed_columns].equals(edited_employees_df):
-                # Preserve any columns not in displayed_columns
-                for col in employees_df.columns:
-                    if col not in edited_employees_df.columns:
-                        edited_employees_df[col] = employees_df[col]
-                save_table("employees", edited_employees_df)
-                st.success("Employees saved successfully!")
+            if _editor_has_edits("editor_employees") and not _frames_equal(df_display_paginated, edited_employees_df):
+                if edited_employees_df.index.equals(df_display_paginated.index):
+                    # Same rows as displayed: write the edited cells back in place
+                    col_positions = employees_df.columns.get_indexer(displayed_columns)
+                    employees_df.iloc[start_idx:end_idx, col_positions] = edited_employees_df[displayed_columns].to_numpy()
+                    df_to_save = employees_df
+                else:
+                    # Rows were added or removed on this page: preserve any columns not in displayed_columns
+                    # for the surviving rows, then stitch the page back between the untouched rows
+                    if list(edited_employees_df.columns) != list(employees_df.columns):
+                        hidden_cols = [c for c in employees_df.columns if c not in edited_employees_df.columns]
+                        if hidden_cols:
+                            edited_employees_df = edited_employees_df.join(employees_df.iloc[start_idx:end_idx][hidden_cols], how="left")
+                        # Every table column is present now, so this only restores the column order
+                        edited_employees_df = edited_employees_df.reindex(columns=employees_df.columns)
+                    # Blank only the text columns that actually hold missing cells instead of rebuilding the whole
+                    # frame; "" in a non-text column would just force it to object dtype
+                    text_cols = edited_employees_df.select_dtypes(include="object")
+                    nan_cols = text_cols.columns[text_cols.isna().any().to_numpy()]
+                    if len(nan_cols):
+                        edited_employees_df[nan_cols] = edited_employees_df[nan_cols].fillna("")
+                    # All three parts share the table's columns, so stitch each column's arrays directly
+                    # rather than paying for concat's index and column alignment; columns keep their dtype
+                    df_to_save = pd.DataFrame({
+                        col: np.concatenate([
+                            employees_df[col].to_numpy()[:start_idx],
+                            edited_employees_df[col].to_numpy(),
+                            employees_df[col].to_numpy()[end_idx:],
+                        ])
+                        for col in employees_df.columns
+                    }, columns=employees_df.columns)
+                save_table("employees", df_to_save)
+                st.success(f"Employees saved successfully! ({_editor_change_summary('editor_employees')})")
                 load_table.clear()
                 st.rerun()
             else:
@@ -1381,7 +1759,7 @@ with settings_tab:
     
     # Workshop Series management
     st.subheader("Workshop Series")
-    workshops_df = load_table("workshops")
+    workshops_df = workshop_df # Already loaded once for this rerun at the top of the script
     
     if not workshops_df.empty:
         edited_workshops_df = st.data_editor(
@@ -1390,9 +1768,9 @@ with settings_tab:
         )
 
         if st.button("💾 Save", key="save_workshops"):
-            if not workshops_df.equals(edited_workshops_df):
+            if _editor_has_edits("editor_workshops") and not _frames_equal(workshops_df, edited_workshops_df):
                 save_table("workshops", edited_workshops_df)
-                st.success("Workshop series saved successfully!")
+                st.success(f"Workshop series saved successfully! ({_editor_change_summary('editor_workshops')})")
                 load_table.clear()
                 st.rerun()
             else:
@@ -1406,35 +1784,4 @@ with settings_tab:
     
     # Backup controls
     with st.expander("Data Backup & Restore", expanded=False):
-        if st.button("Create Backup Now", key="create_backup_btn"):
-            backup_path = create_backup()
-            if backup_path:
-                st.success(f"Backup created at: {backup_path}")
-            else:
-                st.error("Failed to create backup")
-        
-        # List available backups
-        if os.path.exists(BACKUP_DIR):
-            backups = [d for d in os.listdir(BACKUP_DIR) if os.path.isdir(os.path.join(BACKUP_DIR, d))]
-            if backups:
-                backups.sort(reverse=True)  # Most recent first
-                selected_backup = st.selectbox("Available Backups", options=backups, key="backup_select")
-                if st.button("Restore Selected Backup", key="restore_backup_btn"):
-                    backup_path = os.path.join(BACKUP_DIR, selected_backup)
-                    # Confirm before restoring
-                    confirm = st.checkbox("I understand this will overwrite current data", key="confirm_restore")
-                    if confirm and st.button("Confirm Restore", key="confirm_restore_btn"):
-                        # Create a backup of current data before restoring
-                        create_backup()
-                        # Copy files from backup to data directory
-                        for file_name in os.listdir(backup_path):
-                            if file_name.endswith('.csv'):
-                                source_path = os.path.join(backup_path, file_name)
-                                dest_path = os.path.join(DATA_DIR, file_name)
-                                shutil.copy2(source_path, dest_path)
-                        st.success("Backup restored successfully!")
-                        # Clear cache to reload data
-                        load_table.clear()
-                        st.rerun()
-            else:
-                st.info("No backups available")
\ No newline at end of file
+        backup_controls()
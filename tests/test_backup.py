@@ -0,0 +1,47 @@
+import importlib
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """The app module, run from an empty working directory so its data/ and backups/ land in tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    module = importlib.import_module("app")
+    (tmp_path / module.DATA_DIR).mkdir(exist_ok=True)
+    return module
+
+
+def test_backups_in_the_same_second_do_not_share_files(app, monkeypatch):
+    fixed_now = datetime(2024, 1, 2, 3, 4, 5, 678901)
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return fixed_now
+
+    monkeypatch.setattr(app, "datetime", FrozenDatetime)
+    data_file = os.path.join(app.DATA_DIR, "x.csv")
+    unchanged_file = os.path.join(app.DATA_DIR, "y.csv")
+    with open(data_file, "w") as f:
+        f.write("a\nold\n")
+    with open(unchanged_file, "w") as f:
+        f.write("b\nsame\n")
+
+    first_backup = app.create_backup()
+    with open(data_file, "w") as f:
+        f.write("a\nnew\n")
+    second_backup = app.create_backup()
+
+    assert first_backup != second_backup
+    with open(os.path.join(first_backup, "x.csv")) as f:
+        assert f.read() == "a\nold\n"
+    with open(os.path.join(second_backup, "x.csv")) as f:
+        assert f.read() == "a\nnew\n"
+    with open(os.path.join(first_backup, "y.csv")) as f:
+        assert f.read() == "b\nsame\n"
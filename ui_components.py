@@ -1,12 +1,21 @@
 import streamlit as st
 import pandas as pd
 import io
-from typing import List, Tuple
+from typing import Dict, Iterable, List, Set, Tuple, Union
 
 
-def _parse_employee_identifiers(raw_text: str, employees_df: pd.DataFrame) -> Tuple[List[str], List[str]]:
-    """Given a raw multiline string of IDs or emails, validate them against *employees_df*.
-    Handles both line-by-line and comma-separated formats.
+def _employee_lookups(employees_df: pd.DataFrame) -> Tuple[Dict[str, str], Set[str]]:
+    """Build the Email -> Standard ID map and the Standard ID set used to validate identifiers."""
+    if employees_df.empty or "Standard ID" not in employees_df.columns:
+        return {}, set()
+    ids = employees_df["Standard ID"].to_numpy()
+    email_to_id = dict(zip(employees_df["Email"].to_numpy(), ids)) if "Email" in employees_df.columns else {}
+    return email_to_id, set(ids)
+
+
+def _parse_employee_identifiers(raw_text: Union[str, Iterable[str]], lookups: Tuple[Dict[str, str], Set[str]]) -> Tuple[List[str], List[str]]:
+    """Given a raw multiline string (or an iterable of lines) of IDs or emails, validate them against
+    the employee *lookups* from _employee_lookups(). Handles both line-by-line and comma-separated formats.
 
     Returns:
         Tuple[List[str], List[str]]: 
@@ -15,7 +24,8 @@ def _parse_employee_identifiers(raw_text: str, employees_df: pd.DataFrame) -> Tu
     """
     # First split by newlines, then by commas, and flatten the list
     raw_items = []
-    for line in raw_text.strip().split('\n'):
+    lines = raw_text.strip().split('\n') if isinstance(raw_text, str) else raw_text
+    for line in lines:
         # Split by comma and strip whitespace from each item
         items = [item.strip() for item in line.split(',')]
         raw_items.extend(items)
@@ -26,8 +36,7 @@ def _parse_employee_identifiers(raw_text: str, employees_df: pd.DataFrame) -> Tu
     if not raw_items:
         return [], []
 
-    email_to_id = employees_df.set_index("Email")["Standard ID"] if "Email" in employees_df.columns and "Standard ID" in employees_df.columns and not employees_df.empty else pd.Series(dtype=str)
-    id_set = set(employees_df["Standard ID"]) if "Standard ID" in employees_df.columns and not employees_df.empty else set()
+    email_to_id, id_set = lookups
 
     all_identifiers_to_use = []
     inputs_not_found_in_employees = []
@@ -70,6 +79,7 @@ def employee_selector(employees_df: pd.DataFrame, *, key_prefix: str = "") -> Tu
     
     all_collected_ids_for_processing = []
     all_collected_ids_not_in_employees = []
+    lookups = None # Built on first use and shared by the paste and upload tabs
 
     with container:
         tab_paste, tab_select, tab_upload = st.tabs(["Paste List", "Select from List", "Upload File"])
@@ -81,7 +91,8 @@ def employee_selector(employees_df: pd.DataFrame, *, key_prefix: str = "") -> Tu
                 key=f"{key_prefix}_paste",
             )
             if pasted_text:
-                ids_proc, ids_not_found = _parse_employee_identifiers(pasted_text, employees_df)
+                lookups = lookups or _employee_lookups(employees_df)
+                ids_proc, ids_not_found = _parse_employee_identifiers(pasted_text, lookups)
                 all_collected_ids_for_processing.extend(ids_proc)
                 all_collected_ids_not_in_employees.extend(ids_not_found)
                 if ids_proc:
@@ -92,9 +103,9 @@ def employee_selector(employees_df: pd.DataFrame, *, key_prefix: str = "") -> Tu
         # ---- Select from List tab ----
         with tab_select:
             if not employees_df.empty:
-                employee_display_options = [
-                    f"{row['Standard ID']} - {row['Email']}" for _, row in employees_df.iterrows()
-                ]
+                employee_display_options = (
+                    employees_df["Standard ID"].astype(str) + " - " + employees_df["Email"].astype(str)
+                ).tolist()
                 selected_opts = st.multiselect(
                     "Select Employees",
                     options=employee_display_options,
@@ -117,11 +128,17 @@ def employee_selector(employees_df: pd.DataFrame, *, key_prefix: str = "") -> Tu
             )
             if uploaded_file is not None:
                 try:
-                    stringio = io.StringIO(uploaded_file.getvalue().decode("utf-8"))
-                    file_content = stringio.read()
-                    ids_proc_file, ids_not_found_file = _parse_employee_identifiers(
-                        file_content, employees_df
-                    )
+                    # Decode and parse the upload line by line straight from its buffer, without copying
+                    # it into a separate bytes object or one big string first
+                    uploaded_file.seek(0)
+                    file_lines = io.TextIOWrapper(uploaded_file, encoding="utf-8")
+                    lookups = lookups or _employee_lookups(employees_df)
+                    try:
+                        ids_proc_file, ids_not_found_file = _parse_employee_identifiers(
+                            file_lines, lookups
+                        )
+                    finally:
+                        file_lines.detach()  # Leave the uploader's buffer open for later reruns
                     all_collected_ids_for_processing.extend(ids_proc_file)
                     all_collected_ids_not_in_employees.extend(ids_not_found_file)
 
@@ -135,19 +152,8 @@ def employee_selector(employees_df: pd.DataFrame, *, key_prefix: str = "") -> Tu
                     st.error(f"Failed to read uploaded file: {exc}")
 
     # Deduplicate while preserving order of first appearance
-    seen_processing = set()
-    unique_processing_ids = []
-    for eid in all_collected_ids_for_processing:
-        if eid not in seen_processing:
-            seen_processing.add(eid)
-            unique_processing_ids.append(eid)
-
-    seen_not_found = set()
-    unique_not_found_ids = []
-    for eid_nf in all_collected_ids_not_in_employees:
-        if eid_nf not in seen_not_found:
-            seen_not_found.add(eid_nf)
-            unique_not_found_ids.append(eid_nf)
+    unique_processing_ids = list(dict.fromkeys(all_collected_ids_for_processing))
+    unique_not_found_ids = list(dict.fromkeys(all_collected_ids_not_in_employees))
     
     if unique_processing_ids:
         st.write(f"**Total unique identifiers selected/entered for processing:** {len(unique_processing_ids)}")
@@ -219,11 +225,4 @@ def nominator_selector(employees_df: pd.DataFrame, *, key_prefix: str = "") -> L
                 st.warning(f"The following entries from the text area were not recognized as valid emails and will be ignored: {', '.join(parsed_invalid_entries)}")
 
     # Deduplicate while preserving order of first appearance
-    seen_emails = set()
-    unique_emails = []
-    for email in all_emails_collected:
-        if email not in seen_emails:
-            seen_emails.add(email)
-            unique_emails.append(email)
-            
-    return unique_emails 
\ No newline at end of file
+    return list(dict.fromkeys(all_emails_collected))